@@ -1,10 +1,38 @@
-from structs import ProgramState, Line
+from array import array
 
+import numpy as np
 
+from structs import ProgramState, Line, Point
+
+FIELDS = ('lines', 'grad', 'lim', 'state')
+
+
+# Constraint `x1 * a1 + x2 * a2 + b >= 0` and its segment on the plot
+#
+# all seven numbers live in one array of doubles: x1, x2, b, begin.x, begin.y, end.x, end.y,
+# `coeffs` and `line` are built on access
 class LineEntry:
+    __slots__ = ('values',)
+
     def __init__(self, x1: float, x2: float, b: float, line: Line):
-        self.coeffs = [x1, x2, b]
-        self.line = line
+        self.values = array('d', (x1, x2, b, *line.begin, *line.end))
+
+    @property
+    def coeffs(self) -> list[float]:
+        return self.values[:3].tolist()
+
+    @coeffs.setter
+    def coeffs(self, coeffs: list[float]):
+        self.values[:3] = array('d', coeffs)
+
+    @property
+    def line(self) -> Line:
+        values = self.values
+        return Line(Point(values[3], values[4]), Point(values[5], values[6]))
+
+    @line.setter
+    def line(self, line: Line):
+        self.values[3:] = array('d', (*line.begin, *line.end))
 
 
 class Atom:
@@ -15,28 +43,49 @@ class Atom:
         self.lim = lim
         self.observers = []
 
+        # optional `RedrawScheduler` coalescing notifications, observers are updated immediately without it
+        self.scheduler = None
+
+    def values(self) -> np.ndarray:
+        # (N, 7) read-only array of `LineEntry.values` of all lines, one copy of the raw doubles
+        return np.frombuffer(b''.join([entry.values for entry in self.lines]), dtype=float).reshape(-1, 7)
+
+    def coefficients(self) -> np.ndarray:
+        return self.values()[:, :3]
+
+    def segments(self) -> np.ndarray:
+        return self.values()[:, 3:].reshape(-1, 2, 2)
+
     def add_observer(self, observer):
         self.observers.append(observer)
 
     def remove_observer(self, observer):
         self.observers.remove(observer)
 
-    def notify_observers(self):
-        for observer in self.observers:
-            observer.update()
+    def notify_observers(self, *fields, source=None):
+        # `fields` that changed (all by default), `source` observer is not notified about its own change
+        fields = set(fields or FIELDS)
+        observers = [observer for observer in self.observers if observer is not source]
+
+        if self.scheduler is not None:
+            self.scheduler.schedule(observers, fields)
+            return
+
+        for observer in observers:
+            observer.update(fields)
 
     def set_state(self, state: ProgramState):
         self.state = state
-        self.notify_observers()
+        self.notify_observers('state')
 
     def set_lines(self, lines: list[LineEntry]):
         self.lines = lines
-        self.notify_observers()
+        self.notify_observers('lines')
 
     def set_grad(self, grad: list[float]):
         self.grad = grad
-        self.notify_observers()
+        self.notify_observers('grad')
 
     def set_lims(self, lim: float):
         self.lim = lim
-        self.notify_observers()
+        self.notify_observers('lim')
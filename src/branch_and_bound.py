@@ -0,0 +1,220 @@
+import heapq
+import itertools
+import math
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from session import SimplexSession
+from simplex import Status
+
+
+def bound_row(m: int, k: int, sense: str, value: float) -> list:
+    # `x_k <= value` or `x_k >= value` in the `y = a * x + b >= 0` form of `SimplexMethod`
+    row = [0.0] * (m + 1)
+    if sense == '<=':
+        row[k], row[-1] = -1.0, value
+    else:
+        row[k], row[-1] = 1.0, -value
+    return row
+
+
+def encode_basis(column) -> np.ndarray:
+    # basic labels as integers, `x3` -> -3 and `y5` -> 5, so a node in the pool stays small
+    return np.array([-int(label[1:]) if label[0] == 'x' else int(label[1:]) for label in column if label != 'f'],
+                    dtype=np.int32)
+
+
+def decode_basis(codes: np.ndarray) -> list:
+    return ['x' + str(-code) if code < 0 else 'y' + str(code) for code in codes.tolist()]
+
+
+def solve_node(problem, bounds, basis) -> tuple:
+    # LP relaxation of a node, runs in a worker process, so only plain data goes in and out;
+    # the parent basis with the slack of the new bound added is the crash start
+    constraints, function, options = problem
+    m = len(constraints[0]) - 1
+    rows = list(constraints) + [bound_row(m, k, sense, value) for k, sense, value in bounds]
+
+    session = SimplexSession(**options)
+    if basis is not None:
+        session.basis = (None, tuple(decode_basis(basis) + ['y' + str(len(rows))]))
+    steps = session.solve(rows, function)
+    method = session.method
+
+    if method.status != Status.Optimal:
+        return method.status, str(steps[-1]), None, None, None
+
+    x = np.zeros(m)
+    for i, label in enumerate(method.column[:-1]):
+        if label[0] == 'x':
+            x[int(label[1:]) - 1] = method.table[i, -1]
+    # the constant of f, if given, follows the coefficients as in `SimplexMethod`
+    value = float(np.dot(function[:m], x)) + (function[m] if len(function) > m else 0.0)
+    return Status.Optimal, None, x, value, encode_basis(method.column)
+
+
+problem = None
+
+
+def init_worker(data):
+    global problem
+    problem = data
+
+
+def solve_pooled(bounds, basis) -> tuple:
+    return solve_node(problem, bounds, basis)
+
+
+# Branch-and-bound over `SimplexMethod` relaxations: min f(x) with the `integer` variables integral
+#
+# the input is the one of `SimplexMethod`, the root node is its relaxation; a node keeps only its
+# bounds and the optimal basis of its parent, every node is solved from scratch with that basis
+# as the crash start, so nodes are small and can be solved in any process
+#
+# nodes are taken by the best bound ('best') or depth-first ('depth'); once the pool would grow
+# over `memory_limit` bytes, children go on a stack that is searched depth-first before the rest,
+# which finishes subtrees instead of opening new ones; with `workers` > 1 up to that many nodes
+# are solved at once in a process pool
+class BranchAndBound:
+    def __init__(self, constraints, function, integer=None):
+        self.constraints = [list(map(float, row)) for row in constraints]
+        self.function = list(map(float, function))
+        self.m = len(self.constraints[0]) - 1
+        if len(self.function) not in (self.m, self.m + 1):
+            raise ValueError(f"function must have {self.m} coefficients and an optional constant")
+        self.integer = list(range(self.m)) if integer is None else list(integer)
+
+        self.node_selection = 'best'
+        self.workers = 1
+        self.memory_limit = 64 * 1024 * 1024
+        self.max_nodes = None
+        self.time_limit = None
+        self.integrality_tolerance = 1e-6
+        self.gap = 1e-9
+        # the Phase I rule of the original tableau may cycle on the rows of the bounds; the dual
+        # Phase I solves with a tolerance, so nodes do not pivot on rounding errors
+        self.options = {'phase_one': 'dual'}
+
+        self.status = Status.Unsolved
+        self.message = None
+        self.x = None
+        self.optimum = None
+        self.bound = -math.inf
+        self.stats = {'nodes': 0, 'pruned': 0, 'infeasible': 0, 'incumbents': 0, 'dives': 0,
+                      'max_pool': 0, 'max_pool_bytes': 0}
+
+        self.heap = []
+        self.stack = []
+        self.pool_bytes = 0
+        self.sequence = itertools.count()
+
+    def solve(self):
+        deadline = None if self.time_limit is None else time.monotonic() + self.time_limit
+        data = (self.constraints, self.function, self.options)
+        executor = None
+        if self.workers > 1:
+            executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'),
+                                           initializer=init_worker, initargs=(data,))
+
+        self.push((-math.inf, 0, (), None), dive=False)
+        try:
+            while self.heap or self.stack:
+                if self.max_nodes is not None and self.stats['nodes'] >= self.max_nodes:
+                    self.status, self.message = Status.IterationLimit, "node limit reached"
+                    break
+                if deadline is not None and time.monotonic() >= deadline:
+                    self.status, self.message = Status.TimeLimit, "time limit reached"
+                    break
+
+                batch = self.pop_batch(max(1, self.workers))
+                if not batch:
+                    continue
+                if executor is None:
+                    results = [solve_node(data, bounds, basis) for _, _, bounds, basis in batch]
+                else:
+                    results = executor.map(solve_pooled, *zip(*[(bounds, basis) for _, _, bounds, basis in batch]))
+                for node, result in zip(batch, results):
+                    self.process(node, result)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if self.status == Status.Unsolved:
+            self.finish()
+        self.bound = min([node[0] for node in self.pool()] + [math.inf if self.optimum is None else self.optimum])
+        return self.status
+
+    def finish(self):
+        if self.optimum is not None:
+            self.status = Status.Optimal
+        elif self.message is None:
+            self.status, self.message = Status.Failed, "incorrect system"
+        else:
+            self.status = Status.Failed
+
+    def pool(self) -> list:
+        return [entry[-1] for entry in self.heap] + self.stack
+
+    def push(self, node, dive):
+        if dive or self.node_selection == 'depth':
+            self.stack.append(node)
+        else:
+            heapq.heappush(self.heap, (node[0], next(self.sequence), node))
+        self.pool_bytes += self.node_bytes(node)
+        self.stats['max_pool'] = max(self.stats['max_pool'], len(self.heap) + len(self.stack))
+        self.stats['max_pool_bytes'] = max(self.stats['max_pool_bytes'], self.pool_bytes)
+
+    def pop_batch(self, size) -> list:
+        # nodes whose bound is no better than the incumbent are dropped on the way
+        batch = []
+        while len(batch) < size and (self.heap or self.stack):
+            node = self.stack.pop() if self.stack else heapq.heappop(self.heap)[-1]
+            self.pool_bytes -= self.node_bytes(node)
+            if self.optimum is not None and node[0] >= self.optimum - self.gap:
+                self.stats['pruned'] += 1
+                continue
+            batch.append(node)
+        return batch
+
+    @staticmethod
+    def node_bytes(node) -> int:
+        # the basis array, the bound tuples and the node itself
+        _, _, bounds, basis = node
+        return (0 if basis is None else basis.nbytes) + 72 * len(bounds) + 120
+
+    def process(self, node, result):
+        _, depth, bounds, _ = node
+        status, message, x, value, basis = result
+        self.stats['nodes'] += 1
+
+        if status != Status.Optimal:
+            # an unbounded relaxation at the root has no integer optimum to find either
+            if depth == 0:
+                self.message = message
+            self.stats['infeasible'] += 1
+            return
+        if self.optimum is not None and value >= self.optimum - self.gap:
+            self.stats['pruned'] += 1
+            return
+
+        # the most fractional integer variable is branched on
+        fractions = np.abs(x[self.integer] - np.round(x[self.integer]))
+        if len(fractions) == 0 or fractions.max() <= self.integrality_tolerance:
+            self.x = x.copy()
+            self.x[self.integer] = np.round(self.x[self.integer])
+            self.optimum = value
+            self.stats['incumbents'] += 1
+            return
+
+        k = self.integer[int(np.argmax(fractions))]
+        down = (value, depth + 1, bounds + ((k, '<=', math.floor(x[k])),), basis)
+        up = (value, depth + 1, bounds + ((k, '>=', math.ceil(x[k])),), basis)
+        # a full pool dives, and the child on the side x[k] is rounded to comes out first
+        dive = self.pool_bytes + self.node_bytes(down) + self.node_bytes(up) > self.memory_limit
+        if dive and self.node_selection != 'depth':
+            self.stats['dives'] += 1
+        for child in ((down, up) if x[k] - math.floor(x[k]) >= 0.5 else (up, down)):
+            self.push(child, dive)
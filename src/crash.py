@@ -0,0 +1,88 @@
+import numpy as np
+
+
+# Crash procedures: pivots on a fresh `SimplexMethod` that replace the all-`y` starting basis
+# with a better one before the first simplex step, return the number of pivots made
+#
+# both only pivot on violated rows (negative `b`) at a positive element, like a Phase I step, so
+# `x` of the column enters at a positive value and the row is satisfied; the chosen elements form
+# a triangular submatrix, so no pivot changes the element of a later one and none meets a zero;
+# an element below `threshold` of the largest one of its column is never taken, as it would blow
+# up the other rows of that column
+
+def acceptable(table: np.ndarray, n: int, columns, threshold: float) -> np.ndarray:
+    # acceptable pivots among `columns` of the tableau, rows by columns: a positive element of
+    # a violated row, not small for its column, that makes the row feasible before any feasible
+    # row of the column becomes violated, so every crash pivot removes one infeasibility
+    a = table[:n, columns]
+    b = table[:n, -1:]
+    largest = np.abs(a).max(axis=0, initial=0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        limits = np.where((b >= 0) & (a < 0), b / -a, np.inf).min(axis=0, initial=np.inf)
+        steps = -b / a
+    return (a > 0) & (a >= threshold * largest) & (b < 0) & (steps <= limits)
+
+
+def triangular_crash(method, threshold=0.1, tol=1e-9) -> int:
+    # the active row with the fewest active non-zeros takes the acceptable element with the least
+    # cost per unit of the row; columns with a non-zero in that row are dropped, so later columns
+    # are zero in earlier rows and the active part of the tableau is never changed by the pivots
+    n, m = method.n, method.m
+    a = method.table[:n, :m]
+    nonzero = np.abs(a) > tol * max(1.0, float(np.abs(a).max(initial=0.0)))
+    rows = np.ones(n, dtype=bool)
+    columns = np.ones(m, dtype=bool)
+
+    pivots = 0
+    while True:
+        # `b` of the active rows does change, so the violated ones are found every time
+        candidates = acceptable(method.table, n, slice(0, m), threshold) & columns & rows[:, None]
+        counts = np.where(candidates.any(axis=1), (nonzero & columns).sum(axis=1), 0)
+        if not counts.any():
+            return pivots
+
+        i = int(np.argmin(np.where(counts > 0, counts, m + 1)))
+        pool = np.flatnonzero(candidates[i])
+        j = int(pool[np.argmin(method.table[-1, pool] / method.table[i, pool])])
+
+        method.pivot(i, j)
+        pivots += 1
+        rows[i] = False
+        columns[nonzero[i]] = False
+
+
+def bixby_crash(method, threshold=0.1, tol=1e-9) -> int:
+    # after Bixby's crash of CPLEX: columns by increasing cost; a column goes to a row without
+    # basic columns if that row holds at least 0.99 of its largest element, or if the column is
+    # at most 0.01 of the largest basic element in every row that has basic columns; so earlier
+    # columns are zero in later rows and the basis stays well conditioned
+    n, m = method.n, method.m
+    a = np.abs(method.table[:n, :m])
+    scale = tol * max(1.0, float(a.max(initial=0.0)))
+    largest = np.zeros(n)
+    counts = np.zeros(n, dtype=int)
+
+    pivots = 0
+    for j in np.argsort(method.table[-1, :m], kind='stable').tolist():
+        column = a[:, j]
+        gamma = column.max(initial=0.0)
+        if gamma <= scale:
+            continue
+
+        # rows without basic columns are not changed by the pivots, so their `b` is the original one
+        free = np.where((counts == 0) & acceptable(method.table, n, [j], threshold)[:, 0], column, 0.0)
+        i = int(np.argmax(free))
+        if free[i] <= scale:
+            continue
+        taken = counts > 0
+        if free[i] < 0.99 * gamma and (column[taken] > 0.01 * largest[taken]).any():
+            continue
+
+        method.pivot(i, j)
+        pivots += 1
+        np.maximum(largest, column, out=largest)
+        counts[column > scale] += 1
+    return pivots
+
+
+CRASHES = {'triangular': triangular_crash, 'bixby': bixby_crash}
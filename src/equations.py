@@ -74,10 +74,75 @@ def shrink_line(line: Line, factor: float = 0.8) -> Line:
         return line
 
     m = (1 - factor) / 2
-    ab = np.array([line.end.x - line.begin.x, line.end.y - line.begin.y], dtype=float)
-    aa_prime = m * ab
-    a_prime = Point(line.begin.x + float(aa_prime[0]), line.begin.y + float(aa_prime[1]))
-    ba = -ab
-    bb_prime = m * ba
-    b_prime = Point(line.end.x + float(bb_prime[0]), line.end.y + float(bb_prime[1]))
+    dx = line.end.x - line.begin.x
+    dy = line.end.y - line.begin.y
+    a_prime = Point(line.begin.x + m * dx, line.begin.y + m * dy)
+    b_prime = Point(line.end.x - m * dx, line.end.y - m * dy)
     return Line(a_prime, b_prime)
+
+
+# Array versions of the functions above
+# coefficients are (N, 3) arrays of rows `x1, x2, b`, lines are (N, 2, 2) arrays of `[[x, y], [x, y]]`
+def lines_to_table_rows(lines: np.ndarray, rounding=4) -> np.ndarray:
+    lines = np.asarray(lines, dtype=float).reshape(-1, 2, 2)
+    (bx, by), (ex, ey) = lines[:, 0].T, lines[:, 1].T
+    rows = np.column_stack([by - ey, ex - bx, bx * ey - ex * by])
+    norm = np.maximum(1.0, np.maximum(np.abs(rows[:, 0]), np.abs(rows[:, 1])))
+    return np.round(rows / norm[:, None], rounding)
+
+
+def table_rows_to_lines(rows: np.ndarray, lim: float) -> np.ndarray:
+    tol = 1e-6
+    rows = np.asarray(rows, dtype=float).reshape(-1, 3)
+    x1, x2, b = rows.T
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        point1 = np.column_stack([np.zeros_like(b), -b / x2])
+        point2 = np.column_stack([-b / x1, np.zeros_like(b)])
+        point3 = np.column_stack([np.full_like(b, lim), (-b - x1 * lim) / x2])
+        point4 = np.column_stack([(-b - x2 * lim) / x1, np.full_like(b, lim)])
+
+    def inside(values):
+        return (0 <= values) & (values <= lim)
+
+    # regular line: 1,2 ; 1,3 ; 1,4 ; 2,3 ; 2,4 ; 3,4
+    c1, c2, c3 = inside(point1[:, 1])[:, None], inside(point2[:, 0])[:, None], inside(point3[:, 1])[:, None]
+    begin = np.select([c1, c2], [point1, point2], point3)
+    end = np.select([c1 & c2, c1 & c3, c1, c2 & c3], [point2, point3, point4, point3], point4)
+    lines = np.stack([begin, end], axis=1)
+
+    invalid = (np.abs(x1) < tol) & (np.abs(x2) < tol)
+    horizontal = ~invalid & (np.abs(x1) < tol)
+    vertical = ~invalid & ~horizontal & (np.abs(x2) < tol)
+
+    # horizontal and vertical lines go through points 1,3 and 2,4
+    lines[horizontal] = np.stack([point1, point3], axis=1)[horizontal]
+    lines[vertical] = np.stack([point2, point4], axis=1)[vertical]
+    flip = (horizontal & (x2 <= 0.0)) | (vertical & (x1 >= 0.0))
+    lines[flip] = lines[flip][:, ::-1]
+    lines[invalid] = 0
+    return lines
+
+
+def table_rows_to_vectors(rows: np.ndarray, lim: float) -> np.ndarray:
+    rows = np.asarray(rows, dtype=float).reshape(-1, 3)
+    lines = table_rows_to_lines(rows, lim)
+    rows2 = lines_to_table_rows(lines)
+
+    flip = np.any(rows2 * rows < 0.0, axis=1)
+    lines[flip] = lines[flip][:, ::-1]
+    return lines
+
+
+def shrink_lines(lines: np.ndarray, factor: float = 0.8) -> np.ndarray:
+    lines = np.asarray(lines, dtype=float).reshape(-1, 2, 2)
+    if factor > 1 or factor <= 0:
+        return lines.copy()
+
+    m = (1 - factor) / 2
+    ab = lines[:, 1] - lines[:, 0]
+    return np.stack([lines[:, 0] + m * ab, lines[:, 1] - m * ab], axis=1)
+
+
+def array_to_lines(lines: np.ndarray) -> list[Line]:
+    return [Line(Point(*begin), Point(*end)) for begin, end in np.asarray(lines).tolist()]
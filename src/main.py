@@ -4,15 +4,17 @@ import configparser
 from pathlib import Path
 
 from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, \
-    QToolBar, QComboBox, QMessageBox, QSlider, QTableWidgetItem, QFileDialog, QDialog, QLabel, QTextEdit
-from PyQt5.QtCore import Qt
+    QToolBar, QComboBox, QMessageBox, QSlider, QFileDialog, QDialog, QLabel, QTextEdit
+from PyQt5.QtCore import Qt, QThreadPool
 
 from atom import Atom, LineEntry
-from equations import table_row_to_line, shrink_line, table_row_to_vector
+from equations import table_row_to_line, shrink_lines, table_rows_to_vectors, array_to_lines
 from plot_widget import PlotWidget
-from simplex import SimplexMethod, Error
+from scheduler import RedrawScheduler
+from simplex import CancellationToken, Error, Status
 from structs import ProgramState
-from table_widget import TableWidget, is_float
+from table_widget import TableWidget
+from worker import SolveWorker, SolveSignals
 
 
 class AboutDialog(QDialog):
@@ -174,6 +176,12 @@ class MainWindow(QMainWindow):
         self.last_atom = None
         self.tables = None
         self.lines = None
+        self.token = None
+
+        # steps of background solves, see `compute_solution`
+        self.solve_signals = SolveSignals()
+        self.solve_signals.steps.connect(self.add_steps)  # type: ignore
+        self.solve_signals.finished.connect(self.finish_solution)  # type: ignore
 
         # tolerance
         self.plot_widget.pptol = self.config.getfloat('settings', 'point_tolerance')
@@ -188,16 +196,23 @@ class MainWindow(QMainWindow):
         self.plot_widget.optimal_point_color = self.config.get('settings', 'optimal_point_color')
         self.plot_widget.update()
 
-        # reactive reaction
+        # reactive reaction, repaints are coalesced to one per frame
+        self._atom.scheduler = RedrawScheduler()
         self._atom.add_observer(self.table_widget)
         self._atom.add_observer(self.plot_widget)
 
         # solution combo box
         self.combo_box = QComboBox()
+        self.combo_box.currentIndexChanged.connect(self.on_combo_box_changed)  # type: ignore
 
         self.state_button = QPushButton('Перейти к решению')
         self.state_button.clicked.connect(self.switch_state)  # type: ignore
 
+        # the solver runs in the background, steps appear in the combo box as they are found
+        self.cancel_button = QPushButton('Отменить решение')
+        self.cancel_button.setEnabled(False)
+        self.cancel_button.clicked.connect(self.cancel_solution)  # type: ignore
+
         self.insert_row_button = QPushButton('Добавить условие')
         self.insert_row_button.clicked.connect(self.table_widget.insert_row)  # type: ignore
 
@@ -229,6 +244,7 @@ class MainWindow(QMainWindow):
         toolbar = QToolBar()
         toolbar.addWidget(self.combo_box)
         toolbar.addWidget(self.state_button)
+        toolbar.addWidget(self.cancel_button)
         toolbar.addWidget(self.insert_row_button)
         toolbar.addWidget(self.remove_row_button)
         toolbar.addWidget(self.save_button)
@@ -294,8 +310,7 @@ class MainWindow(QMainWindow):
                 self.config['settings'][option] = defaults[option]
 
     def update_limits(self, value):
-        self._atom.lim = value
-        self.plot_widget.update()
+        self._atom.set_lims(value)
 
     def show_help(self):
         dialog = HelpDialog(self)
@@ -306,24 +321,55 @@ class MainWindow(QMainWindow):
         dialog.exec_()
 
     def compute_solution(self):
-        y = []
-        for row in self._atom.lines:
-            y.append(list(map(float, row.coeffs)))
+        y = self._atom.coefficients().tolist()
         c = copy.deepcopy(self._atom.grad)[:-1]
-        self.tables = SimplexMethod(y, c).get_solution()
+        self.tables = []
         self.lines = []
         for line in y:
             self.lines.append(table_row_to_line(*line, self._atom.lim))
         self.grad = self._atom.grad[:-1]
 
+        self.token = CancellationToken()
+        self.cancel_button.setEnabled(True)
+        self.statusBar().showMessage('Решение...')
+        QThreadPool.globalInstance().start(SolveWorker(y, c, self.solve_signals, self.token))
+
+    def add_steps(self, token, steps):
+        # steps of a cancelled or replaced solve are dropped
+        if token is not self.token:
+            return
+
+        for step in steps:
+            if isinstance(step, Error):
+                continue
+            self.tables.append(step)
+            self.combo_box.addItem(f'Шаг {len(self.tables)}')
+        self.statusBar().showMessage(f'Решение... шагов: {len(self.tables)}')
+
+    def finish_solution(self, token, status):
+        if token is not self.token:
+            return
+        self.token = None
+        self.cancel_button.setEnabled(False)
+
+        if status == Status.Cancelled:
+            self.statusBar().showMessage(f'Решение отменено, шагов: {len(self.tables)}')
+            return
+        if status != Status.Optimal:
+            self.statusBar().clearMessage()
+            QMessageBox.critical(self, "Ошибка", "Симплекс метод не имеет решения")
+            self.switch_state()
+            return
+        self.statusBar().showMessage(f'Решение найдено, шагов: {len(self.tables)}')
+
+    def cancel_solution(self):
+        if self.token is not None:
+            self.token.cancel()
+
     def on_combo_box_changed(self, index):
         if index != -1:
             self.table_widget.update_from_info(self.tables[index])
-            self.plot_widget.ax.clear()
-            self.plot_widget.draw_vector(*self.grad)
-            self.plot_widget.draw_lines(self.lines_to_plot)
-            self.plot_widget.draw_point(self.tables[index].x1, self.tables[index].x2)
-            self.plot_widget.canvas.draw()
+            self.plot_widget.show_step(index)
 
     def switch_state(self):
         if self._atom.state == ProgramState.Modification and len(self._atom.lines) == 0:
@@ -336,29 +382,21 @@ class MainWindow(QMainWindow):
             for i in range(len(self._atom.lines)):
                 self.lines_to_plot.append(copy.deepcopy(self._atom.lines[i].line))
 
-            self.compute_solution()
+            # the first step shows up through `on_combo_box_changed`
             self.combo_box.clear()
-
-            for index in range(len(self.tables)):
-                if isinstance(self.tables[index], Error):
-                    QMessageBox.critical(self, "Ошибка", "Симплекс метод не имеет решения")
-                    self.lines_to_plot = []
-                    return
-
-            for i in range(len(self.tables)):
-                self.combo_box.addItem(f'Шаг {i + 1}')
-
-            self.combo_box.currentIndexChanged.connect(self.on_combo_box_changed)
-            self.table_widget.update_from_info(self.tables[0])
-            self.plot_widget.ax.clear()
             self.plot_widget.gradient_color = self.plot_widget.gradient_function_color
             self.plot_widget.selected_gradient = False
-            self.plot_widget.draw_vector(*self.grad)
-            self.plot_widget.draw_point(self.tables[0].x1, self.tables[0].x2)
-            self.plot_widget.draw_lines(self.lines_to_plot)
+            self.compute_solution()
+            self.plot_widget.start_viewing(self.lines_to_plot, self.grad, self.tables)
             new_state = ProgramState.Viewing
             self.state_button.setText('Перейти к редактированию')
         else:
+            if self.token is not None:
+                self.token.cancel()
+                self.token = None
+                self.cancel_button.setEnabled(False)
+            self.statusBar().clearMessage()
+            self.plot_widget.stop_viewing()
             self._atom = self.last_atom
             self.last_atom = None
             self.lines_to_plot = []
@@ -422,10 +460,7 @@ class MainWindow(QMainWindow):
                 QMessageBox.critical(self, "Ошибка", "Неверный формат файла")
                 return
 
-            # disconnect observers
-            self.table_widget.table_widget.itemChanged.disconnect(self.table_widget.data_changed)
-
-            new_lines = []
+            rows = []
             new_grad = []
 
             # load lines and gradient
@@ -438,60 +473,30 @@ class MainWindow(QMainWindow):
                     # it's a line entry
                     if len(row_values) != 3:
                         raise ValueError(f"Неверный формат в строке {row_idx + 1}: {line.strip()}")
-                    x1, x2, b = map(float, row_values)
-                    new_lines.append(LineEntry(x1, x2, b, shrink_line(table_row_to_vector(x1, x2, b, lim=self._atom.lim))))
+                    rows.append(list(map(float, row_values)))
                 else:
                     # it's gradient
                     if len(row_values) != 3:
                         raise ValueError(f"Неверный формат градиента: {line.strip()}")
                     new_grad = list(map(float, row_values))
 
-            # clear existing table and atom data
-            while self.table_widget.table_widget.rowCount() > 0:
-                self.table_widget.table_widget.removeRow(0)
-
-            self._atom.lines = new_lines
-            self._atom.grad = new_grad
-
-            # load into table widget (for visual representation)
-            for i in range(len(self._atom.lines)):
-                row_idx = self.table_widget.table_widget.rowCount()
-                self.table_widget.table_widget.insertRow(row_idx)
-
-                data = self._atom.lines[i].coeffs
-                for col in range(self.table_widget.table_widget.columnCount()):
-                    item = QTableWidgetItem(str(data[col]) if is_float(data[col]) else '0')
-                    item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable)
-                    self.table_widget.table_widget.setItem(row_idx, col, item)
-
-            # gradient
-            row_idx = self.table_widget.table_widget.rowCount()
-            self.table_widget.table_widget.insertRow(row_idx)
-            data = self._atom.grad
-            for col in range(self.table_widget.table_widget.columnCount() - 1):
-                item = QTableWidgetItem(str(data[col]) if is_float(data[col]) else '0')
-                item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable)
-                self.table_widget.table_widget.setItem(row_idx, col, item)
-            item = QTableWidgetItem('0')
-            item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-            self.table_widget.table_widget.setItem(row_idx, 2, item)
+            # build all segments at once
+            segments = array_to_lines(shrink_lines(table_rows_to_vectors(rows, lim=self._atom.lim)))
+            new_lines = [LineEntry(*row, segment) for row, segment in zip(rows, segments)]
 
             # Load limits
             lims = int(lines[-1].strip())
+
+            # table and plot pick the new data up from the atom
+            self._atom.lines = new_lines
+            self._atom.grad = new_grad
             self.limit_slider.setValue(lims)  # set value
             self._atom.lim = lims  # save to variable
 
-            self.table_widget.update_labels()
-
-            # reconnect observers
-            self.table_widget.table_widget.itemChanged.connect(self.table_widget.data_changed)
-
             QMessageBox.information(self, "Успех", "Таблица загружена")
             self._atom.notify_observers()
 
         except Exception as e:
-            # reconnect observers
-            self.table_widget.table_widget.itemChanged.connect(self.table_widget.data_changed)
             QMessageBox.critical(self, "Ошибка", f"Не удалось загрузить таблицу по причине: {e}")
 
 
@@ -1,14 +1,21 @@
 import math
+from collections import OrderedDict
+
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QVBoxLayout, QWidget, QApplication
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import numpy as np
 import time
 
+from matplotlib.collections import LineCollection
 from matplotlib.figure import Figure
+from matplotlib.patches import Polygon
 from matplotlib.ticker import MultipleLocator
 
-from atom import Atom, LineEntry
-from equations import line_to_table_row, table_row_to_vector, shrink_line
+from atom import Atom, LineEntry, FIELDS
+from equations import line_to_table_row, table_row_to_vector, shrink_line, lines_to_table_rows, table_rows_to_vectors
+from polygon import FeasibleRegion, clip_polygon
+from spatial_index import SpatialIndex
 from structs import ProgramState, Line, Point
 
 
@@ -48,6 +55,41 @@ def gradient_point(line: Line, scale=1.0) -> Point:
     return Point(mid_x - dy / norm_factor * scale, mid_y + dx / norm_factor * scale)
 
 
+class FrameCache:
+    # LRU of rendered frames, bounded by the total size of the images
+    def __init__(self, max_bytes=64 << 20):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.frames = OrderedDict()
+
+    def __contains__(self, key):
+        return key in self.frames
+
+    def __len__(self):
+        return len(self.frames)
+
+    def get(self, key):
+        if key not in self.frames:
+            return None
+        self.frames.move_to_end(key)
+        return self.frames[key][0]
+
+    def put(self, key, frame, size: int):
+        if key in self.frames:
+            self.bytes -= self.frames.pop(key)[1]
+        self.frames[key] = (frame, size)
+        self.bytes += size
+
+        # the newest frame is always kept
+        while self.bytes > self.max_bytes and len(self.frames) > 1:
+            _, (_, evicted) = self.frames.popitem(last=False)
+            self.bytes -= evicted
+
+    def clear(self):
+        self.frames.clear()
+        self.bytes = 0
+
+
 class PlotWidget(QWidget):
     def __init__(self, atom: Atom):
         super().__init__()
@@ -61,6 +103,7 @@ class PlotWidget(QWidget):
         self.gradient_line_color = 'red'
         self.gradient_function_color = 'blue'
         self.optimal_point_color = 'red'
+        self.region_color = 'tab:blue'
         self.pptol = 0.15
         self.pltol = 0.15
         self.min_scale = 10
@@ -76,6 +119,7 @@ class PlotWidget(QWidget):
         self.canvas.mpl_connect('button_press_event', self.on_click)  # type: ignore
         self.canvas.mpl_connect('motion_notify_event', self.on_drag)  # type: ignore
         self.canvas.mpl_connect('button_release_event', self.on_release)  # type: ignore
+        self.canvas.mpl_connect('draw_event', self.on_draw)  # type: ignore
 
         layout = QVBoxLayout()
         layout.addWidget(self.canvas)
@@ -97,6 +141,43 @@ class PlotWidget(QWidget):
         # tolerance to determine if points are too close
         self.drag_tolerance = 0.5
 
+        # artists reused between redraws: all constraints share one collection of each kind
+        self.line_collection = None
+        self.point_collection = None
+        self.arrow_quiver = None
+        self.arrow_key = None
+        self.moving_group = []
+        self.temp_artist = None
+        self.vector_artist = None
+
+        # feasible region, recomputed only when the lines or limits change
+        self.region = FeasibleRegion()
+        self.region_patch = None
+
+        # region of all lines but the dragged one, cached when a drag starts, so a motion event
+        # only clips it by the dragged line and does not depend on the number of constraints
+        self.static_region = FeasibleRegion()
+        self.static_vertices = None
+
+        # grid of lines and points for hit-testing, kept in sync with the artists
+        self.hit_index = SpatialIndex()
+
+        # blitting: static scene cached while dragging, only moving artists are redrawn
+        self.background = None
+        self.animated = []
+
+        # solution viewer: the scene without the point is drawn once, steps are blitted
+        # from cached frames and the neighbours of the shown step are rendered when idle
+        self.steps = []
+        self.step_index = None
+        self.step_artist = None
+        self.step_background = None
+        self.frames = FrameCache()
+        self.prefetch_queue = []
+        self.prefetch_timer = QTimer()
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.timeout.connect(self.prefetch_next)  # type: ignore
+
     def get_screen_dpi(self):
         """Gets the screen DPI (dots per inch)."""
         app = QApplication.instance()
@@ -128,13 +209,26 @@ class PlotWidget(QWidget):
     def update_canvas(self):
         self.update_lines()
 
-    def update(self):
-        if self.__atom.state == ProgramState.Modification:
+    def update(self, fields=None):
+        # only the artists that depend on the changed `fields` are updated
+        fields = set(FIELDS if fields is None else fields)
+        if self.__atom.state != ProgramState.Modification:
+            if fields & {'lim', 'state'}:
+                self.update_grid()
+            return
+
+        # lines and state change the whole scene, and every constraint artist (vector lines up to
+        # the limit, arrow sizes, the region, hit cells) is scale-dependent, so `lim` syncs them too
+        if fields & {'lines', 'state', 'lim'} or self.vector_artist is None or self.vector_artist.axes is not self.ax:
             self.update_grid()
             self.update_canvas()
-            self.canvas.draw()
-        else:
-            self.update_grid()
+            return
+
+        if 'grad' in fields:
+            # the arrow of f is the only artist of the gradient
+            self.stop_blit()
+            self.update_function_vector()
+            self.canvas.draw_idle()
 
     def remove_line(self, event):
         if self.__atom.state != ProgramState.Modification:
@@ -150,7 +244,7 @@ class PlotWidget(QWidget):
             self.first_point = None
             self.temp_line = None
             self.__atom.lines.pop(idx)
-            self.__atom.notify_observers()
+            self.__atom.notify_observers('lines')
 
     def on_left_mouse_press(self, event):
         if self.__atom.state != ProgramState.Modification:
@@ -174,7 +268,7 @@ class PlotWidget(QWidget):
             # if modifying, check if we are clicking on a point to drag
             self.dragging_point = None
 
-            for i in range(len(self.__atom.lines)):
+            for i in self.hit_candidates(event.xdata, event.ydata, points=True):
                 line: Line = self.__atom.lines[i].line
                 if is_point_on_point(event.xdata, event.ydata, line.begin, tolerance=self.pptol * self.scale()):
                     self.dragging_point = 0
@@ -188,7 +282,7 @@ class PlotWidget(QWidget):
 
             if self.dragging_point is None:
                 # check if we are clicking on the line itself to drag the entire line
-                for i in range(len(self.__atom.lines)):
+                for i in self.hit_candidates(event.xdata, event.ydata):
                     if is_point_on_line(event.xdata, event.ydata, self.__atom.lines[i].line, tolerance=self.pltol * self.scale()):
                         self.selected_line = i
                         self.dragging_line = i
@@ -207,7 +301,7 @@ class PlotWidget(QWidget):
         if self.selected_gradient:
             self.selected_gradient = False
             self.gradient_color = self.gradient_function_color
-            self.__atom.notify_observers()
+            self.__atom.notify_observers('grad')
             return
 
         if self.selected_line is not None:
@@ -231,7 +325,7 @@ class PlotWidget(QWidget):
                 self.__atom.lines[i].line = shrink_line(table_row_to_vector(*self.__atom.lines[i].coeffs, self.__atom.lim))
 
         # call update
-        self.__atom.notify_observers()
+        self.__atom.notify_observers('lines')
 
     def on_click(self, event):
         if self.__atom.state != ProgramState.Modification:
@@ -267,7 +361,8 @@ class PlotWidget(QWidget):
             return
 
         self.modifying = False
-        for i in range(len(self.__atom.lines)):
+        candidates = self.hit_candidates(event.xdata, event.ydata) + self.hit_candidates(event.xdata, event.ydata, points=True)
+        for i in sorted(set(candidates)):
             # update selected line if double click detected
             current_line: Line = self.__atom.lines[i].line
             if is_point_on_line(event.xdata, event.ydata, current_line, tolerance=self.pltol * self.scale()):
@@ -287,7 +382,7 @@ class PlotWidget(QWidget):
                     self.__atom.lines[i].line.begin
                 )
                 self.__atom.lines[i].coeffs = list(map(float, line_to_table_row(self.__atom.lines[i].line, 2)))
-                self.__atom.notify_observers()
+                self.__atom.notify_observers('lines')
                 return
 
     def on_drag(self, event):
@@ -313,7 +408,7 @@ class PlotWidget(QWidget):
             dx = round(event.xdata - self.__atom.lim / 2, 2)
             dy = round(event.ydata - self.__atom.lim / 2, 2)
             self.__atom.grad = [dx, dy, 0]
-            self.update_lines()
+            self.update_moving()
             return
 
         if self.dragging_point is not None and self.selected_line is not None:
@@ -358,7 +453,7 @@ class PlotWidget(QWidget):
         elif self.dragging_point is None and self.temp_line is not None:
             self.temp_line = Line(self.first_point, Point(event.xdata, event.ydata))
 
-        self.update_lines()
+        self.update_moving()
 
     def on_release(self, event):
         if self.__atom.state != ProgramState.Modification:
@@ -380,6 +475,8 @@ class PlotWidget(QWidget):
             return
 
         if self.selected_gradient:
+            # bring the dragged arrow back into the regular scene
+            self.update_lines()
             return
 
         if self.dragging_point is not None and self.selected_line is not None:
@@ -409,7 +506,7 @@ class PlotWidget(QWidget):
             self.__atom.lines.append(LineEntry(x1, x2, b, line))
             self.colors = [self.default_line_color] * len(self.__atom.lines)
             self.first_point = None
-            self.__atom.notify_observers()
+            self.__atom.notify_observers('lines')
 
     def highlight_points(self, line, markersize=5):
         self.ax.plot(line.begin.x, line.begin.y, color=self.default_point_color, marker='.', markersize=markersize)
@@ -418,22 +515,17 @@ class PlotWidget(QWidget):
     def draw_lines(self, lines):
         self.update_grid()
 
-        for line in lines:
-            line_original = line
-            x1, x2, b = map(float, line_to_table_row(line_original, 2))
-            line = table_row_to_vector(x1, x2, b, self.__atom.lim)
-
-            self.ax.plot([line_original.begin.x, line_original.end.x], [line_original.begin.y, line_original.end.y], color=self.default_line_color)
-            self.ax.plot([line.begin.x, line.end.x], [line.begin.y, line.end.y], color=self.default_line_color)
-            self.draw_gradient(line_original)
+        segments, vectors, arrows = self.line_arrays(lines)
+        self.draw_region(self.region.get(lines_to_table_rows(segments, 2), self.__atom.lim))
+        self.ax.add_collection(LineCollection(np.concatenate([segments, vectors]), colors=self.default_line_color), autolim=False)
+        self.draw_arrows(arrows)
 
         self.canvas.draw()
 
     def draw_point(self, x, y, markersize=5):
         self.ax.plot(x, y, color=self.optimal_point_color, marker='s', markersize=markersize)
 
-    def draw_vector(self, x, y):
-        self.update_grid()
+    def function_vector(self, x, y):
         norm_factor = math.sqrt(x * x + y * y)
         if norm_factor < 1e-4:
             norm_factor = 1
@@ -442,33 +534,281 @@ class PlotWidget(QWidget):
         dir_y = y / norm_factor * 1.5 * self.scale()
         x0 = self.__atom.lim / 2
         y0 = self.__atom.lim / 2
+        return x0, y0, dir_x, dir_y
 
-        self.ax.arrow(x0, y0, dir_x, dir_y, head_width=0.2 * self.scale(), head_length=0.1 * self.scale(), fc=self.gradient_color, ec=self.gradient_color, zorder=2)
-
-    def update_lines(self):
-        self.ax.clear()
+    def draw_vector(self, x, y):
         self.update_grid()
+        x0, y0, dir_x, dir_y = self.function_vector(x, y)
+        return self.ax.arrow(x0, y0, dir_x, dir_y, head_width=0.2 * self.scale(), head_length=0.1 * self.scale(), fc=self.gradient_color, ec=self.gradient_color, zorder=2)
+
+    def moving_line(self):
+        # index of the line that follows the mouse, if any
+        if self.selected_line is not None and (self.dragging_point is not None or self.dragging_line is not None):
+            return self.selected_line
+        return None
+
+    def moving_artists(self) -> list:
+        artists = []
+        if self.moving_line() is not None:
+            artists.append(self.region_patch)
+            artists += self.moving_group
+        if self.temp_line is not None:
+            artists.append(self.temp_artist)
+        if self.selected_gradient:
+            artists.append(self.vector_artist)
+        return artists
+
+    def line_arrays(self, lines):
+        # (N, 2, 2) segments, (N, 2, 2) vector lines and (N, 4) gradient arrows of `lines`
+        segments = np.array([[line.begin, line.end] for line in lines], dtype=float).reshape(-1, 2, 2)
+        vectors = table_rows_to_vectors(lines_to_table_rows(segments, 2), self.__atom.lim)
+
+        direction = segments[:, 1] - segments[:, 0]
+        norm_factor = np.hypot(direction[:, 0], direction[:, 1])
+        norm_factor[norm_factor < 1e-6] = 1
+        arrows = np.column_stack([
+            segments.mean(axis=1),
+            -direction[:, 1] / norm_factor * self.scale(),
+            direction[:, 0] / norm_factor * self.scale(),
+        ])
+        return segments, vectors, arrows
+
+    def draw_region(self, vertices):
+        # `Polygon` needs at least one vertex, an empty region is drawn as a single point
+        return self.ax.add_patch(Polygon(vertices if len(vertices) else np.zeros((1, 2)), closed=True,
+                                         color=self.region_color, alpha=0.2, linewidth=0, zorder=0))
+
+    def all_segments(self):
+        return self.__atom.segments()
+
+    def update_region(self, segments):
+        vertices = self.region.get(lines_to_table_rows(segments, 2), self.__atom.lim)
+        self.region_patch.set_xy(vertices if len(vertices) else np.zeros((1, 2)))
+
+    def update_hit_index(self, segments):
+        # cells of twice the hit tolerance, covering the visible part of the axes
+        cell = 2 * max(self.pptol, self.pltol) * self.scale()
+        tl = 2 * self.__atom.lim / 100
+        self.hit_index.update(segments, (-tl - cell, self.__atom.lim + cell), cell, self.scale())
+
+    def hit_candidates(self, x, y, points=False):
+        # lines that may be hit at (x, y), the exact test is left to the caller
+        candidates = self.hit_index.query_points(x, y) if points else self.hit_index.query_lines(x, y)
+        return [i for i in candidates if i < len(self.__atom.lines)]
+
+    def draw_arrows(self, arrows):
+        # width and heads in data units, matching the former `ax.arrow` look
+        return self.ax.quiver(arrows[:, 0], arrows[:, 1], arrows[:, 2], arrows[:, 3], angles='xy', scale_units='xy',
+                              scale=1, units='xy', width=0.01 * self.scale(), headwidth=12, headlength=10,
+                              headaxislength=9, color=self.gradient_line_color, zorder=2)
+
+    def sync_artists(self, skip=None):
+        # axes were cleared by someone else (e.g. solution viewer), create the artists again
+        if self.vector_artist is None or self.vector_artist.axes is not self.ax:
+            self.ax.clear()
+            self.update_grid()
+            self.region_patch = self.draw_region(np.empty((0, 2)))
+            self.line_collection = self.ax.add_collection(LineCollection([]), autolim=False)
+            self.point_collection = self.ax.scatter([], [], s=25, marker='.', color=self.default_point_color, zorder=3)
+            self.arrow_quiver = None
+            self.moving_group = self.draw_moving_group()
+            self.temp_artist = self.ax.plot([], [], color='r')[0]
+            self.vector_artist = self.draw_vector(*self.__atom.grad[:-1])
 
         if len(self.colors) != len(self.__atom.lines):
             self.colors = [self.default_line_color] * len(self.__atom.lines)
 
-        for i in range(len(self.__atom.lines)):
-            line = self.__atom.lines[i].line
-            linev = table_row_to_vector(*line_to_table_row(line, 2), self.__atom.lim)
-
-            self.ax.plot([linev.begin.x, linev.end.x], [linev.begin.y, linev.end.y], color=self.colors[i], lw=1)
-            self.ax.plot([line.begin.x, line.end.x], [line.begin.y, line.end.y], color=self.colors[i], lw=3)
-            self.highlight_points(line)
-            self.draw_gradient(line)
+        indices = [i for i in range(len(self.__atom.lines)) if i != skip]
+        segments, vectors, arrows = self.line_arrays([self.__atom.lines[i].line for i in indices])
+        colors = [self.colors[i] for i in indices]
+
+        self.line_collection.set_segments(np.concatenate([vectors, segments]))
+        self.line_collection.set_linewidths([1] * len(indices) + [3] * len(indices))
+        self.line_collection.set_colors(colors + colors)
+        self.point_collection.set_offsets(segments.reshape(-1, 2))
+        self.point_collection.set_color(self.default_point_color)
+
+        # quiver size is fixed on creation, rebuild it only when the count or the scale changed
+        key = (len(indices), self.scale(), self.gradient_line_color)
+        if self.arrow_quiver is None or self.arrow_key != key:
+            if self.arrow_quiver is not None:
+                self.arrow_quiver.remove()
+            self.arrow_quiver = self.draw_arrows(arrows)
+            self.arrow_key = key
+        else:
+            self.arrow_quiver.set_offsets(arrows[:, :2])
+            self.arrow_quiver.set_UVC(arrows[:, 2], arrows[:, 3])
+
+        segments = self.all_segments()
+        self.update_region(segments)
+        self.update_hit_index(segments)
+        if skip is None:
+            for artist in self.moving_group:
+                artist.set_visible(False)
+        else:
+            self.update_moving_group(skip)
+        self.update_temp_line()
+        self.update_function_vector()
 
-        if self.temp_line is not None:
-            line = self.temp_line
-            self.ax.plot([line.begin.x, line.end.x], [line.begin.y, line.end.y], color='r')
+    def update_lines(self, moving=False):
+        # with `moving` set the dragged artists are left out of the picture
+        self.stop_blit()
+        self.update_grid()
+        self.sync_artists(self.moving_line() if moving else None)
 
-        self.draw_vector(*self.__atom.grad[:-1])
+        for artist in self.moving_artists() if moving else []:
+            artist.set_animated(True)
         self.canvas.draw()
 
-    def draw_gradient(self, line):
+    def draw_moving_group(self):
+        # [vector line, segment, endpoints, gradient arrow] of the dragged line
+        return [
+            self.ax.plot([], [], lw=1)[0],
+            self.ax.plot([], [], lw=3)[0],
+            self.ax.plot([], [], color=self.default_point_color, marker='.', markersize=5, linestyle='')[0],
+            self.draw_gradient(Line(Point(0, 0), Point(0, 0))),
+        ]
+
+    def update_moving_group(self, i):
+        vector, segment, points, arrow = self.moving_group
+        line = self.__atom.lines[i].line
+        linev = table_row_to_vector(*line_to_table_row(line, 2), self.__atom.lim)
+
+        vector.set_data([linev.begin.x, linev.end.x], [linev.begin.y, linev.end.y])
+        segment.set_data([line.begin.x, line.end.x], [line.begin.y, line.end.y])
+        points.set_data([line.begin.x, line.end.x], [line.begin.y, line.end.y])
+        vector.set_color(self.colors[i])
+        segment.set_color(self.colors[i])
+        points.set_color(self.default_point_color)
+
+        x, y, dx, dy = self.gradient_vector(line)
+        arrow.set_data(x=x, y=y, dx=dx, dy=dy, head_width=0.12 * self.scale(), head_length=0.1 * self.scale())
+        arrow.set_color(self.gradient_line_color)
+
+        for artist in self.moving_group:
+            artist.set_visible(True)
+
+    def update_temp_line(self):
+        line = self.temp_line
+        if line is None:
+            self.temp_artist.set_data([], [])
+        else:
+            self.temp_artist.set_data([line.begin.x, line.end.x], [line.begin.y, line.end.y])
+
+    def update_function_vector(self):
+        x, y, dx, dy = self.function_vector(*self.__atom.grad[:-1])
+        self.vector_artist.set_data(x=x, y=y, dx=dx, dy=dy, head_width=0.2 * self.scale(), head_length=0.1 * self.scale())
+        self.vector_artist.set_color(self.gradient_color)
+
+    def start_blit(self):
+        self.update_lines(moving=True)
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.animated = self.moving_artists()
+
+        moving = self.moving_line()
+        if moving is not None:
+            rows = np.delete(lines_to_table_rows(self.all_segments(), 2), moving, axis=0)
+            self.static_vertices = self.static_region.get(rows, self.__atom.lim)
+
+    def update_moving_region(self, i):
+        row = line_to_table_row(self.__atom.lines[i].line, 2)
+        vertices = clip_polygon(self.static_vertices, *row)
+        self.region_patch.set_xy(vertices if len(vertices) else np.zeros((1, 2)))
+
+    def stop_blit(self):
+        for artist in self.animated:
+            artist.set_animated(False)
+        self.background = None
+        self.animated = []
+        self.static_vertices = None
+
+    def update_moving(self):
+        if self.background is None:
+            self.start_blit()
+
+        # move only the dragged artists
+        moving = self.moving_line()
+        if moving is not None:
+            self.update_moving_region(moving)
+            self.update_moving_group(moving)
+        self.update_temp_line()
+        if self.selected_gradient:
+            self.update_function_vector()
+
+        self.canvas.restore_region(self.background)
+        for artist in self.animated:
+            self.ax.draw_artist(artist)
+        self.canvas.blit(self.ax.bbox)
+
+    def start_viewing(self, lines, grad, steps):
+        # `steps` may still grow while the solver runs
+        self.stop_viewing()
+        self.steps = steps
+        self.ax.clear()
+        self.draw_vector(*grad)
+        self.step_artist = self.ax.plot([], [], color=self.optimal_point_color, marker='s', markersize=5, animated=True)[0]
+        self.draw_lines(lines)
+
+    def stop_viewing(self):
+        self.prefetch_timer.stop()
+        self.prefetch_queue = []
+        self.frames.clear()
+        self.steps = []
+        self.step_index = None
+        self.step_artist = None
+        self.step_background = None
+
+    def on_draw(self, event):
+        # full redraw (first draw, resize): take the new background, cached frames are stale
+        if self.step_artist is None:
+            return
+        self.step_background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.frames.clear()
+        if self.step_index is not None:
+            self.draw_step(self.step_index)
+
+    def draw_step(self, index):
+        info = self.steps[index]
+        self.step_artist.set_data([info.x1], [info.x2])
+        self.ax.draw_artist(self.step_artist)
+
+    def render_frame(self, index):
+        self.canvas.restore_region(self.step_background)
+        self.draw_step(index)
+        frame = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.frames.put(index, frame, int(self.ax.bbox.width * self.ax.bbox.height * 4))
+        return frame
+
+    def frame(self, index):
+        frame = self.frames.get(index)
+        return frame if frame is not None else self.render_frame(index)
+
+    def show_step(self, index):
+        if self.step_background is None:
+            return
+
+        self.step_index = index
+        self.canvas.restore_region(self.frame(index))
+        self.canvas.blit(self.ax.bbox)
+
+        # nearest neighbours first
+        self.prefetch_queue = [i for i in (index + 1, index - 1, index + 2, index - 2) if 0 <= i < len(self.steps)]
+        self.prefetch_timer.start(0)
+
+    def prefetch_next(self):
+        # one frame per event loop pass, so input is handled between them
+        while self.prefetch_queue:
+            index = self.prefetch_queue.pop(0)
+            if index in self.frames or self.step_background is None:
+                continue
+            self.render_frame(index)
+
+            # leave the shown step in the buffer for the next paint
+            self.canvas.restore_region(self.frame(self.step_index))
+            self.prefetch_timer.start(0)
+            return
+
+    def gradient_vector(self, line):
         x1, y1 = line.begin
         x2, y2 = line.end
         mid_x = (x1 + x2) / 2
@@ -483,6 +823,10 @@ class PlotWidget(QWidget):
 
         dir_x = -dy / norm_factor * self.scale()
         dir_y = dx / norm_factor * self.scale()
+        return mid_x, mid_y, dir_x, dir_y
+
+    def draw_gradient(self, line):
+        mid_x, mid_y, dir_x, dir_y = self.gradient_vector(line)
 
         # draw the gradient arrow
-        self.ax.arrow(mid_x, mid_y, dir_x, dir_y, head_width=0.12 * self.scale(), head_length=0.1 * self.scale(), fc=self.gradient_line_color, ec=self.gradient_line_color, zorder=2)
+        return self.ax.arrow(mid_x, mid_y, dir_x, dir_y, head_width=0.12 * self.scale(), head_length=0.1 * self.scale(), fc=self.gradient_line_color, ec=self.gradient_line_color, zorder=2)
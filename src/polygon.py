@@ -0,0 +1,131 @@
+import math
+from collections import deque
+
+import numpy as np
+
+EPS = 1e-9
+
+
+class HalfPlane:
+    # a1 * x + a2 * y + b >= 0, i.e. the left side of the line through `p` along `d`
+    def __init__(self, a1: float, a2: float, b: float):
+        norm = a1 * a1 + a2 * a2
+        self.p = (-b * a1 / norm, -b * a2 / norm)
+        self.d = (a2, -a1)
+        self.angle = math.atan2(self.d[1], self.d[0])
+
+    def out(self, point) -> bool:
+        cross = self.d[0] * (point[1] - self.p[1]) - self.d[1] * (point[0] - self.p[0])
+        return cross < -EPS * math.hypot(*self.d)
+
+
+def intersection(h1: HalfPlane, h2: HalfPlane):
+    cross = h1.d[0] * h2.d[1] - h1.d[1] * h2.d[0]
+    t = ((h2.p[0] - h1.p[0]) * h2.d[1] - (h2.p[1] - h1.p[1]) * h2.d[0]) / cross
+    return h1.p[0] + t * h1.d[0], h1.p[1] + t * h1.d[1]
+
+
+def feasible_polygon(rows, lim: float) -> np.ndarray:
+    # vertices (counter-clockwise) of {x >= 0, y >= 0, x <= lim, y <= lim, rows >= 0}, empty if infeasible
+    planes = [HalfPlane(1, 0, 0), HalfPlane(0, 1, 0), HalfPlane(-1, 0, lim), HalfPlane(0, -1, lim)]
+    for a1, a2, b in rows:
+        if abs(a1) < EPS and abs(a2) < EPS:
+            if b < 0:
+                return np.empty((0, 2))
+            continue
+        planes.append(HalfPlane(a1, a2, b))
+
+    # sort by angle, then sweep keeping only planes that bound the region: O(n log n)
+    planes.sort(key=lambda h: h.angle)
+    dq = deque()
+    for h in planes:
+        while len(dq) > 1 and h.out(intersection(dq[-1], dq[-2])):
+            dq.pop()
+        while len(dq) > 1 and h.out(intersection(dq[0], dq[1])):
+            dq.popleft()
+
+        # parallel to the last one: keep the tighter of the two
+        if dq and abs(h.d[0] * dq[-1].d[1] - h.d[1] * dq[-1].d[0]) < EPS:
+            if h.d[0] * dq[-1].d[0] + h.d[1] * dq[-1].d[1] < 0:
+                return np.empty((0, 2))
+            if not h.out(dq[-1].p):
+                continue
+            dq.pop()
+        dq.append(h)
+
+    while len(dq) > 2 and dq[0].out(intersection(dq[-1], dq[-2])):
+        dq.pop()
+    while len(dq) > 2 and dq[-1].out(intersection(dq[0], dq[1])):
+        dq.popleft()
+
+    if len(dq) < 3:
+        return np.empty((0, 2))
+    vertices = np.array([intersection(dq[i], dq[(i + 1) % len(dq)]) for i in range(len(dq))])
+
+    # the sweep can leave a polygon of an empty intersection (a plane that cuts off everything is
+    # only compared with the ends of the deque), a feasible region has all vertices inside every plane
+    # (`HalfPlane.out` of all vertices and planes at once)
+    p, d = np.array([h.p for h in planes]), np.array([h.d for h in planes])
+    cross = np.outer(vertices[:, 1], d[:, 0]) - np.outer(vertices[:, 0], d[:, 1])
+    cross -= p[:, 1] * d[:, 0] - p[:, 0] * d[:, 1]
+    if (cross < -1e-7 * (1 + np.abs(vertices).max()) * np.hypot(d[:, 0], d[:, 1])).any():
+        return np.empty((0, 2))
+    return vertices
+
+
+def clip_polygon(vertices, a1: float, a2: float, b: float) -> np.ndarray:
+    # convex polygon cut by `a1 * x + a2 * y + b >= 0` in O(len(vertices)), order is kept
+    if len(vertices) == 0:
+        return vertices
+    if abs(a1) < EPS and abs(a2) < EPS:
+        return vertices if b >= 0 else np.empty((0, 2))
+
+    s = vertices @ np.array([a1, a2]) + b
+    inside = s >= -EPS * math.hypot(a1, a2)
+    if inside.all():
+        return vertices
+    if not inside.any():
+        return np.empty((0, 2))
+
+    # every vertex inside is kept, every edge that crosses the line adds its crossing point
+    following, s_following = np.roll(vertices, -1, axis=0), np.roll(s, -1)
+    crossing = inside != np.roll(inside, -1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.where(crossing, s / (s - s_following), 0.0)
+    points = vertices + t[:, None] * (following - vertices)
+    return np.stack([vertices, points], axis=1).reshape(-1, 2)[np.stack([inside, crossing], axis=1).reshape(-1)]
+
+
+class FeasibleRegion:
+    # caches the polygon, it is rebuilt only when the rows or limits change
+    def __init__(self):
+        self.key = None
+        self.vertices = np.empty((0, 2))
+
+    def get(self, rows, lim: float) -> np.ndarray:
+        rows = np.asarray(rows, dtype=float).reshape(-1, 3)
+        key = (rows.tobytes(), lim)
+        if key != self.key:
+            self.vertices = feasible_polygon(rows.tolist(), lim)
+            self.key = key
+        return self.vertices
+
+
+def solve_2d(constraints, function, bound=1e7) -> (float, float, float):
+    # min f(x1, x2) by evaluating vertices of the feasible region, same task as `SimplexMethod`
+    vertices = feasible_polygon(constraints, bound)
+    if len(vertices) == 0:
+        raise ValueError("incorrect system")
+
+    values = vertices @ np.asarray(function[:2], dtype=float)
+    on_bound = vertices.max(axis=1) >= bound * (1 - 1e-9)
+
+    # an optimal face may run up to the artificial bound with a finite value, it then also has
+    # a vertex off the bound; only an optimum that is on the bound alone means f is unbounded
+    optimal = values <= values.min() + 1e-9 * (1 + np.abs(values).max())
+    if on_bound[optimal].all():
+        raise ValueError("simplex method does not converge")
+
+    best = int(np.flatnonzero(optimal & ~on_bound)[np.argmin(values[optimal & ~on_bound])])
+    x1, x2 = vertices[best]
+    return float(x1), float(x2), float(values[best])
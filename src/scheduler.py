@@ -0,0 +1,33 @@
+import time
+
+from PyQt5.QtCore import QTimer
+
+
+# Coalesces `Atom` notifications: every observer is updated at most once per frame
+# with the union of fields that changed since its last update
+class RedrawScheduler:
+    def __init__(self, fps=60):
+        self.interval = 1.0 / fps
+        self.dirty = {}
+        self.last_flush = 0.0
+
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.flush)  # type: ignore
+
+    def schedule(self, observers, fields):
+        for observer in observers:
+            self.dirty.setdefault(observer, set()).update(fields)
+
+        if not self.timer.isActive():
+            delay = self.interval - (time.monotonic() - self.last_flush)
+            self.timer.start(max(0, int(delay * 1000)))
+
+    def flush(self):
+        self.timer.stop()
+        self.last_flush = time.monotonic()
+
+        # observers may notify again while updating, those changes go to the next frame
+        dirty, self.dirty = self.dirty, {}
+        for observer, fields in dirty.items():
+            observer.update(fields)
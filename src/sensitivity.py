@@ -0,0 +1,140 @@
+import math
+from typing import NamedTuple
+
+from simplex import SimplexMethod
+
+
+class Range(NamedTuple):
+    lower: float
+    upper: float
+
+    def contains(self, value: float, tol=1e-9) -> bool:
+        return self.lower - tol <= value <= self.upper + tol
+
+
+def is_optimal(method: SimplexMethod, tol=1e-9) -> bool:
+    table = method.table
+    n = len(method.column) - 1
+    m = len(method.row) - 1
+    if any(table[i][-1] < -tol for i in range(n)):
+        return False
+    return all(table[-1][j] >= -tol for j in range(m))
+
+
+# Sensitivity report of an optimal tableau
+#
+# every basic variable is written as v = sum(table[i][j] * u_j) + table[i][-1]
+# over the non-basic variables u_j, and the objective as f = sum(table[-1][j] * u_j) + const,
+# so ranges, shadow prices and reduced costs are read directly from the tableau
+class Sensitivity:
+    def __init__(self, method: SimplexMethod, tol=1e-9):
+        if not is_optimal(method, tol):
+            raise ValueError("tableau is not optimal")
+
+        self.tol = tol
+        self.m = len(method.row) - 1
+        self.n = len(method.column) - 1
+        self.table = [list(row) for row in method.table]
+        self.row = method.row[:-1]
+        self.column = method.column[:-1]
+        self.function = list(method.function)
+
+        self.structural = ['x' + str(_) for _ in range(1, len(self.function) + 1)]
+        self.reduced_costs = self.compute_reduced_costs()
+        self.shadow_prices = self.compute_shadow_prices()
+        self.cost_ranges = self.compute_cost_ranges()
+        self.rhs_ranges = self.compute_rhs_ranges(method.rhs)
+
+    def compute_reduced_costs(self) -> dict:
+        reduced_costs = {label: 0.0 for label in self.column}
+        for j in range(self.m):
+            reduced_costs[self.row[j]] = self.table[-1][j]
+        return reduced_costs
+
+    def compute_shadow_prices(self) -> dict:
+        # increasing `b` of a binding constraint by `d` changes f by `-d * reduced cost`
+        shadow_prices = {}
+        for label in self.row + self.column:
+            if label.startswith('y'):
+                shadow_prices[label] = -self.reduced_costs[label] if label in self.row else 0.0
+        return shadow_prices
+
+    def compute_cost_ranges(self) -> dict:
+        ranges = {}
+        for p, label in enumerate(self.structural):
+            c = self.function[p]
+
+            # non-basic: only its own reduced cost depends on `c`
+            if label in self.row:
+                ranges[label] = Range(c - self.reduced_costs[label], math.inf)
+                continue
+
+            # basic: every reduced cost shifts by `d * table[i][j]`
+            i = self.column.index(label)
+            lower, upper = -math.inf, math.inf
+            for j in range(self.m):
+                a = self.table[i][j]
+                if abs(a) < self.tol:
+                    continue
+                bound = -self.table[-1][j] / a
+                if a > 0:
+                    lower = max(lower, bound)
+                else:
+                    upper = min(upper, bound)
+            ranges[label] = Range(c + lower, c + upper)
+        return ranges
+
+    def compute_rhs_ranges(self, rhs: dict) -> dict:
+        ranges = {}
+        for label, b in rhs.items():
+            # basic: only its own value depends on `b`
+            if label in self.column:
+                i = self.column.index(label)
+                ranges[label] = Range(b - self.table[i][-1], math.inf)
+                continue
+
+            if label not in self.row:
+                continue
+
+            # non-basic: every basic value shifts by `-d * table[i][j]`
+            j = self.row.index(label)
+            lower, upper = -math.inf, math.inf
+            for i in range(self.n):
+                a = self.table[i][j]
+                if abs(a) < self.tol:
+                    continue
+                bound = self.table[i][-1] / a
+                if a > 0:
+                    upper = min(upper, bound)
+                else:
+                    lower = max(lower, bound)
+            ranges[label] = Range(b + lower, b + upper)
+        return ranges
+
+    def reduced_costs_for(self, function) -> list:
+        costs = {label: function[p] for p, label in enumerate(self.structural)}
+        reduced_costs = [costs.get(label, 0.0) for label in self.row]
+        for i, label in enumerate(self.column):
+            c = costs.get(label, 0.0)
+            if c == 0:
+                continue
+            for j in range(self.m):
+                reduced_costs[j] += c * self.table[i][j]
+        return reduced_costs
+
+    def is_optimal_for(self, function) -> bool:
+        return all(d >= -self.tol for d in self.reduced_costs_for(function))
+
+    def evaluate(self, function):
+        # optimum for another objective without pivoting, None if the basis is no longer optimal
+        function = list(function)[:len(self.structural)]
+        if not self.is_optimal_for(function):
+            return None
+
+        values = {label: 0.0 for label in self.structural}
+        for i, label in enumerate(self.column):
+            if label in values:
+                values[label] = self.table[i][-1]
+
+        optimum = sum(function[p] * values[label] for p, label in enumerate(self.structural))
+        return values.get('x1', 0), values.get('x2', 0), optimum
@@ -0,0 +1,270 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from simplex import SimplexMethod, Error, Status
+from verification import Verification
+
+
+def solution_vector(row, column, table) -> list:
+    # every structural variable, `x1` and `x2` of `Info` are only the first two
+    x = [0.0] * sum(label[0] == 'x' for label in row + column)
+    for i, label in enumerate(column[:-1]):
+        if label[0] == 'x':
+            x[int(label[1:]) - 1] = float(table[i, -1])
+    return x
+
+
+def info_to_dict(info) -> dict:
+    return {
+        'row': list(info.row),
+        'column': list(info.column),
+        # the objective row has one coefficient per variable, without the padding of `Info.table`
+        'table': info.table[:-1].tolist() + [info.table[-1, :len(info.row) - 1].tolist()],
+        'i': info.i,
+        'j': info.j,
+        'x1': info.x1,
+        'x2': info.x2,
+        'x': solution_vector(info.row, info.column, info.table),
+        # f of all variables, `Info.optimum` is f of `x1` and `x2` only
+        'optimum': float(info.table[-1, -1]),
+    }
+
+
+def solve(constraints, function, time_limit=None) -> dict:
+    # runs in a worker process, so only plain data goes in and out
+    method = SimplexMethod(constraints, function)
+    steps = method.get_solution(time_limit=time_limit)
+
+    error = None
+    if isinstance(steps[-1], Error):
+        error = str(steps.pop())
+
+    steps = [info_to_dict(info) for info in steps]
+    last = steps[-1]
+    return {
+        'error': error,
+        'x1': last['x1'],
+        'x2': last['x2'],
+        'x': last['x'],
+        'optimum': last['optimum'],
+        'steps': steps,
+        # zero-step pivots, cycles and perturbations, see `SimplexMethod.stats`
+        'stalling': dict(method.stats),
+        # KKT residuals of the optimum against the input, see `Verification`
+        'verification': Verification(method, constraints, function).to_dict()
+        if method.status == Status.Optimal else None,
+    }
+
+
+def parse_problem(payload) -> (list, list):
+    if not isinstance(payload, dict):
+        raise ValueError("problem must be an object")
+
+    constraints = payload.get('constraints')
+    function = payload.get('function')
+    if not isinstance(constraints, list) or len(constraints) == 0:
+        raise ValueError("`constraints` must be a non-empty list")
+    if not isinstance(function, list):
+        raise ValueError("`function` must be a list")
+
+    width = len(function) + 1
+    if width < 3:
+        raise ValueError("`function` must have at least 2 coefficients")
+
+    for row in constraints + [function]:
+        if not isinstance(row, list) or not all(isinstance(x, (int, float)) and not isinstance(x, bool) for x in row):
+            raise ValueError("coefficients must be numbers")
+    for row in constraints:
+        if len(row) != width:
+            raise ValueError(f"every constraint must have {width} coefficients")
+
+    return [list(map(float, row)) for row in constraints], list(map(float, function))
+
+
+class Metrics:
+    def __init__(self, window=1000):
+        self.requests = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.latencies = deque(maxlen=window)
+
+    def enter(self):
+        self.queue_depth += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+
+    def leave(self, started):
+        self.queue_depth -= 1
+        self.latencies.append(time.monotonic() - started)
+
+    def snapshot(self) -> dict:
+        latencies = sorted(self.latencies)
+
+        def percentile(q):
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+
+        return {
+            'requests': self.requests,
+            'completed': self.completed,
+            'rejected': self.rejected,
+            'timeouts': self.timeouts,
+            'errors': self.errors,
+            'queue_depth': self.queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'latency': {
+                'count': len(latencies),
+                'mean': sum(latencies) / len(latencies) if latencies else 0.0,
+                'p50': percentile(0.5),
+                'p95': percentile(0.95),
+                'max': latencies[-1] if latencies else 0.0,
+            },
+        }
+
+
+# Local HTTP/JSON front-end for SimplexMethod
+#
+# POST /solve   {"constraints": [[a1, a2, b], ...], "function": [c1, c2], "deadline": 5.0}
+# GET  /metrics latency and queue depth statistics
+class SolverService:
+    reasons = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+               413: 'Payload Too Large', 500: 'Internal Server Error', 503: 'Service Unavailable',
+               504: 'Gateway Timeout'}
+
+    def __init__(self, host='127.0.0.1', port=8080, workers=None, max_queue=64, deadline=10.0,
+                 max_body=1 << 20):
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.max_queue = max_queue
+        self.deadline = deadline
+        self.max_body = max_body
+        self.metrics = Metrics()
+        self.pool = None
+        self.server = None
+
+    async def start(self):
+        # forked workers would inherit accepted client sockets and keep them open
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'))
+        self.server = await asyncio.start_server(self.handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+        self.pool.shutdown(cancel_futures=True)
+
+    async def serve_forever(self):
+        await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def handle(self, reader, writer):
+        try:
+            status, body = await self.dispatch(reader)
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            status, body = 400, {'error': 'malformed request'}
+
+        data = json.dumps(body).encode('utf-8')
+        writer.write(
+            f"HTTP/1.1 {status} {self.reasons[status]}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: close\r\n\r\n".encode('latin-1') + data
+        )
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        writer.close()
+
+    async def dispatch(self, reader) -> (int, dict):
+        request_line = (await reader.readline()).decode('latin-1').split()
+        if len(request_line) != 3:
+            raise ValueError("bad request line")
+        method, path, _ = request_line
+
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode('latin-1').strip()
+            if not line:
+                break
+            key, _, value = line.partition(':')
+            headers[key.strip().lower()] = value.strip()
+
+        if path == '/metrics':
+            if method != 'GET':
+                return 405, {'error': 'use GET'}
+            return 200, self.metrics.snapshot()
+
+        if path != '/solve':
+            return 404, {'error': f'unknown path {path}'}
+        if method != 'POST':
+            return 405, {'error': 'use POST'}
+
+        length = int(headers.get('content-length', '0'))
+        if length > self.max_body:
+            return 413, {'error': 'problem is too large'}
+        body = await reader.readexactly(length)
+
+        try:
+            payload = json.loads(body)
+            constraints, function = parse_problem(payload)
+            deadline = float(payload.get('deadline', self.deadline))
+        except (ValueError, TypeError) as e:
+            return 400, {'error': str(e)}
+
+        return await self.solve(constraints, function, min(deadline, self.deadline))
+
+    async def solve(self, constraints, function, deadline) -> (int, dict):
+        self.metrics.requests += 1
+
+        # backpressure: refuse instead of queueing without bound
+        if self.metrics.queue_depth >= self.max_queue:
+            self.metrics.rejected += 1
+            return 503, {'error': 'solver queue is full'}
+
+        started = time.monotonic()
+        self.metrics.enter()
+        try:
+            # the worker gets the same budget so it does not keep solving after a timeout
+            future = asyncio.get_running_loop().run_in_executor(self.pool, solve, constraints, function, deadline)
+            result = await asyncio.wait_for(future, deadline)
+        except asyncio.TimeoutError:
+            self.metrics.timeouts += 1
+            return 504, {'error': 'deadline exceeded'}
+        except Exception as e:
+            # the problem was validated, so a failing worker (`BrokenProcessPool`, a bug) is ours
+            self.metrics.errors += 1
+            return 500, {'error': f'{type(e).__name__}: {e}'}
+        finally:
+            self.metrics.leave(started)
+
+        self.metrics.completed += 1
+        return 200, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simplex solver HTTP/JSON service")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--max-queue', type=int, default=64)
+    parser.add_argument('--deadline', type=float, default=10.0)
+    args = parser.parse_args()
+
+    service = SolverService(args.host, args.port, args.workers, args.max_queue, args.deadline)
+    asyncio.run(service.serve_forever())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+from simplex import SimplexMethod, Status
+
+
+# Solves a stream of related problems, each one starting from the optimal basis of the previous one
+#
+# the basis is kept as the `row`/`column` labels of the last optimal tableau; the next problem is
+# pivoted into it (a crash start) and solved from there, by the dual simplex if only `b` broke it;
+# a basis that does not fit the new problem or is singular falls back to a cold start, and so does
+# a warm solve that fails, so a session never answers differently from a single `SimplexMethod`
+#
+# `options` are set as attributes of every `SimplexMethod`, e.g. `phase_one='dual'`
+class SimplexSession:
+    def __init__(self, **options):
+        self.options = options
+        self.basis = None
+        self.method = None
+        self.stats = {'warm': 0, 'cold': 0, 'fallbacks': 0, 'crash_pivots': 0, 'iterations': 0}
+
+    def solve(self, constraints, function, max_iterations=None, time_limit=None, token=None) -> list:
+        steps = None
+        if self.basis is not None:
+            method = self.create(constraints, function)
+            if method.set_basis(self.basis[1]):
+                crash_pivots = method.iteration
+                steps = self.warm_solution(method, max_iterations, time_limit, token)
+                if method.status == Status.Failed:
+                    steps = None
+                else:
+                    self.stats['warm'] += 1
+                    self.stats['crash_pivots'] += crash_pivots
+            if steps is None:
+                self.stats['fallbacks'] += 1
+
+        if steps is None:
+            method = self.create(constraints, function)
+            steps = method.get_solution(max_iterations, time_limit, token)
+            self.stats['cold'] += 1
+
+        self.stats['iterations'] += method.iteration
+        self.method = method
+        if method.status == Status.Optimal:
+            self.basis = (tuple(method.row), tuple(method.column))
+        return steps
+
+    def create(self, constraints, function) -> SimplexMethod:
+        method = SimplexMethod(constraints, function)
+        for name, value in self.options.items():
+            setattr(method, name, value)
+        return method
+
+    @staticmethod
+    def warm_solution(method: SimplexMethod, max_iterations, time_limit, token) -> list:
+        # a changed `b` leaves the reduced costs of the old optimum non-negative
+        table = method.table
+        primal = (table[:method.n, -1] >= 0).all()
+        dual = (table[-1, :method.m] >= 0).all()
+        if dual and not primal:
+            return method.get_dual_solution(max_iterations, time_limit, token)
+        return method.get_solution(max_iterations, time_limit, token)
+
+    def reset(self):
+        self.basis = None
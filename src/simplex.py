@@ -1,7 +1,38 @@
-import copy
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+
+import numpy as np
+
+from crash import CRASHES
+
+
+class Status(Enum):
+    Unsolved = 1
+    Optimal = 2
+    Failed = 3
+    IterationLimit = 4
+    TimeLimit = 5
+    Cancelled = 6
+
+
+class CancellationToken:
+    def __init__(self):
+        self.event = threading.Event()
+
+    def cancel(self):
+        self.event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.event.is_set()
 
 
 class Error:
+    __slots__ = ('error_string',)
+
     def __init__(self, error_string):
         self.error_string = error_string
 
@@ -9,11 +40,29 @@ class Error:
         return self.error_string
 
 
+def table_to_array(table, fill=0.0) -> np.ndarray:
+    # rows of `table` as one float64 array, short rows (the objective) are padded with `fill`
+    if isinstance(table, np.ndarray):
+        return np.array(table, dtype=float)
+
+    width = max(len(row) for row in table)
+    array = np.full((len(table), width), fill, dtype=float)
+    for k, row in enumerate(table):
+        array[k, :len(row)] = row
+    return array
+
+
+# One step of the solution
+#
+# steps are kept for the whole solution, so labels are tuples and the table is
+# a single float64 array whose objective row ends with the value of f
 class Info:
+    __slots__ = ('row', 'column', 'table', 'i', 'j', 'x1', 'x2', 'optimum')
+
     def __init__(self, row, column, table, i, j, x1, x2, optimum):
-        self.row = row.copy()
-        self.column = column.copy()
-        self.table = copy.deepcopy(table)
+        self.row = tuple(row)
+        self.column = tuple(column)
+        self.table = table_to_array(table, optimum)
         self.i = i
         self.j = j
         self.x1 = x1
@@ -26,17 +75,101 @@ class SimplexMethod:
         self.n = len(constraints)
         self.m = len(constraints[0]) - 1
         self.invalid_index = 1 + max(self.n, self.m)
+        self.next_label = self.n + 1
+        self.iteration = 0
+        self.status = Status.Unsolved
+        self.checkpoint_path = None
+        self.checkpoint_every = None
+        self.checkpoint_interval = None
+        self.last_checkpoint = (0, 0.0)
+
+        # None: exact comparisons with zero, the original rule; a number: values within it count as zero
+        self.tolerance = None
+
+        # entering column: 'first' negative reduced cost (the original rule), 'partial' - the most
+        # negative in a window of `pricing_window` columns that rotates over the objective row,
+        # 'multiple' - the most negative of `pricing_candidates` columns picked by a full scan
+        # every `pricing_refresh` pivots
+        self.pricing = 'first'
+        self.pricing_window = 1000
+        self.pricing_candidates = 16
+        self.pricing_refresh = 10
+        self.pricing_start = 0
+        self.candidates = np.empty(0, dtype=int)
+        self.candidates_iteration = 0
+
+        # `pivot` splits the update of large tableaux across `threads` threads, in blocks
+        # of `thread_block` elements per line range; 1 keeps the single-threaded loop
+        self.threads = 1
+        self.thread_block = 32768
+        self.executor = None
+        self.thread_buffers = None
+
+        # degenerate pivots (zero steps at a vertex with zero `b`) are counted in `stats`;
+        # `stall_limit` of them in a row or a repeated `row`/`column` label state (a cycle)
+        # make `solution_steps` add a small positive perturbation to `b`: 'lexicographic' -
+        # decreasing from the first row on, 'random', None - only count; the perturbation is
+        # carried through pivots separately and removed once the perturbed problem is solved
+        #
+        # the exact ratio test passes over blocking rows with zero `b`, so already the first
+        # zero step leaves the feasible region, hence the limit of 1
+        self.perturbation_mode = 'lexicographic'
+        self.perturbation_scale = 1e-7
+        self.perturbation_rounds = 3
+        self.perturbation_seed = 0
+        self.stall_limit = 1
+        self.perturbation = None
+        self.perturbation_delta = 0.0
+        self.stalled = False
+        self.degenerate_run = 0
+        self.visited = set()
+        self.stats = {'degenerate': 0, 'longest_run': 0, 'cycles': 0, 'perturbations': 0}
+
+        # Phase I (negative `b`): 'first' - the first positive element of the first violated row,
+        # the original rule, which may cycle away from the all-`y` basis; 'dual' - dual simplex
+        # steps for random positive costs carried through pivots in `phase_costs`; the dual steps
+        # leave `1e-16` where the original rule had exact zeros, which exact comparisons take for
+        # pivots, so 'dual' solves with `tolerance` 1e-9 unless one is set
+        self.phase_one = 'first'
+        self.phase_costs = None
+
+        # starting basis: None - all `y` basic, 'triangular' or 'bixby' - pivots of `crash.py`
+        # made before the first step of a fresh solve, their number goes to `crash_pivots`
+        self.crash = None
+        self.crash_pivots = 0
+
         self.function = function
         self.row = ['x' + str(_) for _ in range(1, self.m + 1)]
         self.column = ['y' + str(_) for _ in range(1, self.n + 1)]
         self.row.append('-b')
         self.column.append('f')
 
-        # add constraints
-        self.table = [constraint for constraint in constraints]
-
-        # add function
-        self.table.append(function)
+        # original `b` of every constraint by its label
+        self.rhs = {self.column[i]: constraints[i][-1] for i in range(self.n)}
+
+        # constraints and function in one array, the objective row gets the constant of f (0 at the origin)
+        self.buffers = None
+        self.set_table(table_to_array(list(constraints) + [function]))
+
+    def set_table(self, table: np.ndarray):
+        # pivots ping-pong between two buffers of the tableau shape, the pivot row and
+        # column are cached in vectors and products go to `scratch`,
+        # so `pivot` allocates no arrays as long as the shape does not change
+        #
+        # the update runs line by line along the shorter side, because broadcasting the
+        # outer product makes numpy allocate a temporary of the whole tableau; buffers are
+        # laid out so those lines are contiguous (row-major for wide tableaux)
+        shape = table.shape
+        if self.buffers is None or self.buffers[0].shape != shape:
+            self.by_rows = shape[0] < shape[1]
+            order = 'C' if self.by_rows else 'F'
+            self.buffers = (np.empty(shape, order=order), np.empty(shape, order=order))
+            self.scratch = np.empty(shape[1] if self.by_rows else shape[0])
+            self.pivot_row = np.empty(shape[1])
+            self.pivot_column = np.empty(shape[0])
+        self.active = 0
+        self.buffers[0][...] = table
+        self.table = self.buffers[0]
 
     def print_table(self):
         print("\t", end='')
@@ -61,84 +194,168 @@ class SimplexMethod:
         x2 = 0
 
         if x1_i != self.invalid_index:
-            x1 = self.table[x1_i][-1]
+            x1 = float(self.table[x1_i, -1])
         if x2_i != self.invalid_index:
-            x2 = self.table[x2_i][-1]
+            x2 = float(self.table[x2_i, -1])
 
         return x1, x2
 
     def pick_element(self) -> (bool, int, int, float):
+        tol = 0.0 if self.tolerance is None else self.tolerance
+        table = self.table
+
         # find negative in `-b` column
-        target_row = self.invalid_index
-        for idx in range(self.n):
-            if self.table[idx][-1] < 0:
-                target_row = idx
-                break
+        negative = np.flatnonzero(table[:self.n, -1] < -tol)
+        if len(negative) and self.phase_one == 'dual':
+            return self.pick_phase_one(negative, tol)
+        self.phase_costs = None
 
         # if negative element in `-b` exists then search for non-negative element in row
-        if target_row != self.invalid_index:
-            # find non-negative element in row
-            target_column = self.invalid_index
-            for column in range(self.m):
-                if self.table[target_row][column] > 0:
-                    target_column = column
-                    break
+        if len(negative):
+            target_row = int(negative[0])
+            positive = np.flatnonzero(table[target_row, :self.m] > tol)
 
             # logic error?
-            if target_column == self.invalid_index:
+            if len(positive) == 0:
                 raise ValueError("incorrect system")
 
-            return True, target_row, target_column, self.table[target_row][target_column]
+            target_column = int(positive[0])
+            return True, target_row, target_column, table[target_row, target_column]
 
         # if no negative element in `-b` column then search negative element in row `c`
-        target_column = self.invalid_index
-        for idx in range(self.m):
-            if self.table[-1][idx] < 0:
-                target_column = idx
-                break
+        target_column = self.price(tol)
 
         # if no negative element in `c` column, then optimum already found
-        if target_column == self.invalid_index:
+        if target_column is None:
             x1, x2 = self.find_optimum()
             return False, x1, x2, self.f(x1, x2)
 
-        # otherwise find max negative num:
-        # `m` where (-b_m) / (table[m][neg_index]) -> max < 0
-        target_row = self.invalid_index
-        first_try = True
-        min_val = 1
+        if self.tolerance is None:
+            target_row = self.ratio_test(target_column)
+        else:
+            target_row = self.tolerant_ratio_test(target_column)
+        return True, target_row, target_column, table[target_row, target_column]
+
+    def pick_phase_one(self, negative, tol) -> (bool, int, int, float):
+        # a dual simplex step for the objective if it is dual feasible, otherwise for random
+        # positive costs, which are dual feasible at any basis they are set at; the most violated
+        # row leaves, so `b` ends non-negative or a row without positive elements proves that
+        # the system is incorrect
+        table = self.table
+        costs = self.phase_costs
+        if costs is None:
+            if (table[-1, :self.m] >= 0).all():
+                # the objective itself is dual feasible, so the dual steps go straight to the optimum
+                costs = table[-1]
+            else:
+                rng = np.random.default_rng(self.perturbation_seed)
+                costs = self.phase_costs = np.append(1 + rng.random(self.m), 0.0)
+
+        # pivots below the rounding level of the row are not taken, whatever the tolerance
+        target_row = int(negative[np.argmin(table[negative, -1])])
+        pivot_tol = max(tol, 1e-9 * float(np.abs(table[target_row, :self.m]).max()))
+        columns = np.flatnonzero(table[target_row, :self.m] > pivot_tol)
+        if len(columns) == 0:
+            raise ValueError("incorrect system")
+
+        target_column = int(columns[np.argmin(costs[columns] / table[target_row, columns])])
+        return True, target_row, target_column, table[target_row, target_column]
+
+    def price(self, tol):
+        # entering column by `self.pricing`, None if every reduced cost is non-negative
+        costs = self.table[-1, :self.m]
+        if self.pricing == 'partial':
+            return self.partial_price(costs, tol)
+        if self.pricing == 'multiple':
+            return self.multiple_price(costs, tol)
+
+        negative = np.flatnonzero(costs < -tol)
+        return int(negative[0]) if len(negative) else None
+
+    def partial_price(self, costs, tol):
+        # windows are scanned from `pricing_start` on until one has a candidate or the row is done
+        width = min(self.pricing_window, self.m)
+        for offset in range(0, self.m, width):
+            start = (self.pricing_start + offset) % self.m
+            window = costs[start:start + width]
+            if start + width > self.m:
+                window = np.concatenate([window, costs[:start + width - self.m]])
+
+            best = int(np.argmin(window))
+            if window[best] < -tol:
+                self.pricing_start = (start + width) % self.m
+                return (start + best) % self.m
+        return None
+
+    def multiple_price(self, costs, tol):
+        # candidates that became non-negative are dropped, an empty list forces a full scan
+        if self.iteration - self.candidates_iteration >= self.pricing_refresh:
+            self.candidates = np.empty(0, dtype=int)
+        self.candidates = self.candidates[costs[self.candidates] < -tol]
+
+        if len(self.candidates) == 0:
+            negative = np.flatnonzero(costs < -tol)
+            if len(negative) == 0:
+                return None
+
+            count = min(self.pricing_candidates, len(negative))
+            self.candidates = negative[np.argpartition(costs[negative], count - 1)[:count]]
+            self.candidates_iteration = self.iteration
+
+        return int(self.candidates[np.argmin(costs[self.candidates])])
+
+    def ratio_test(self, target_column) -> int:
+        # original rule over `val = -b / a` of rows with `a != 0`: the negative `val` closest
+        # to zero (the last one of equals), otherwise the first zero, otherwise no pivot
+        column = self.table[:self.n, target_column]
+        rows = np.flatnonzero(column != 0)
+        if len(rows) == 0:
+            raise ValueError("simplex method does not converge")
 
-        for row in range(self.n):
-            if self.table[row][target_column] == 0:
-                continue
+        values = self.table[rows, -1] / column[rows]
+        negative = values < 0
+        if negative.any():
+            best = values[negative].max()
+            return int(rows[np.flatnonzero(negative & (values == best))[-1]])
 
-            val = self.table[row][-1] / self.table[row][target_column]
+        zero = np.flatnonzero(values == 0)
+        if len(zero) == 0:
+            raise ValueError("simplex method does not converge")
+        return int(rows[zero[0]])
+
+    def tolerant_ratio_test(self, target_column) -> int:
+        # min `b / -a` over rows with `a < -tol`; ratios within `tol` of the minimum are ties,
+        # of them the largest `|a|` (then the first row) is taken for a stable pivot
+        tol = self.tolerance
+        column = self.table[:self.n, target_column]
+        rows = np.flatnonzero(column < -tol)
+        if len(rows) == 0:
+            raise ValueError("simplex method does not converge")
 
-            if first_try:
-                min_val = val
-                target_row = row
-                first_try = False
-                continue
+        ratios = np.maximum(self.table[rows, -1], 0) / -column[rows]
+        ties = rows[ratios <= ratios.min() + tol]
+        return int(ties[np.argmax(-column[ties])])
 
-            if val == 0 and min_val > 0:
-                min_val = val
-                target_row = row
-                continue
+    def pick_dual_element(self) -> (bool, int, int, float):
+        tol = 0.0 if self.tolerance is None else self.tolerance
+        table = self.table
 
-            if val < 0 <= min_val:
-                min_val = val
-                target_row = row
-                continue
+        # find negative in `-b` column
+        negative = np.flatnonzero(table[:self.n, -1] < -tol)
 
-            if min_val <= val < 0:
-                min_val = val
-                target_row = row
-                continue
+        # primal feasible, nothing to do for dual simplex
+        if len(negative) == 0:
+            x1, x2 = self.find_optimum()
+            return False, x1, x2, self.f(x1, x2)
 
-        if first_try or min_val > 0:
-            raise ValueError("simplex method does not converge")
+        # choose positive element with min `c_j / table[r][j]` to keep row `c` non-negative
+        target_row = int(negative[0])
+        columns = np.flatnonzero(table[target_row, :self.m] > tol)
+        if len(columns) == 0:
+            raise ValueError("incorrect system")
 
-        return True, target_row, target_column, self.table[target_row][target_column]
+        target_column = int(columns[np.argmin(table[-1, columns] / table[target_row, columns])])
+        return True, target_row, target_column, table[target_row, target_column]
 
     def recalculate_matrix(self):
         _is_successful, r, c, _ = self.pick_element()
@@ -146,58 +363,396 @@ class SimplexMethod:
         if not _is_successful:
             return
 
-        new_table = copy.deepcopy(self.table)
+        self.pivot(r, c)
+
+    def pivot(self, r, c):
+        table = self.table
+        new_table = self.buffers[1 - self.active]
+        row, column, scratch = self.pivot_row, self.pivot_column, self.scratch
+        row[...] = table[r]
+        column[...] = table[:, c]
+        e = float(row[c])
 
         # swap variables
         self.row[c], self.column[r] = self.column[r], self.row[c]
 
-        # step 1: divide row with picked element by `-e`
-        for column in range(len(new_table[r])):
-            new_table[r][column] = -self.table[r][column] / self.table[r][c]
+        # step 1: recalculate matrix, `(t[rw][column] * e - t[r][column] * t[rw][c]) / e`
+        if self.threads > 1:
+            self.parallel_update(table, new_table, e)
+        elif self.by_rows:
+            for i in range(len(column)):
+                target = new_table[i]
+                np.multiply(table[i], e, out=target)
+                np.multiply(row, column[i], out=scratch)
+                np.subtract(target, scratch, out=target)
+                np.divide(target, e, out=target)
+        else:
+            for j in range(len(row)):
+                target = new_table[:, j]
+                np.multiply(table[:, j], e, out=target)
+                np.multiply(column, row[j], out=scratch)
+                np.subtract(target, scratch, out=target)
+                np.divide(target, e, out=target)
+
+        # step 2: divide row with picked element by `-e`
+        np.negative(row, out=new_table[r])
+        np.divide(new_table[r], e, out=new_table[r])
+
+        # step 3: divide column with picked element by `e`
+        np.divide(column, e, out=new_table[:, c])
+
+        # step 4: inverse picked element
+        new_table[r, c] = 1.0 / e
+
+        # the perturbation of `b` is transformed as the `-b` column, in place of the copied column
+        if self.perturbation is not None:
+            p_r = self.perturbation[r]
+            np.multiply(column, p_r / e, out=column)
+            np.subtract(self.perturbation, column, out=self.perturbation)
+            self.perturbation[r] = -p_r / e
+
+        # Phase I costs are transformed as the objective row, in place of the copied row
+        if self.phase_costs is not None:
+            w_c = self.phase_costs[c]
+            np.multiply(row, w_c / e, out=row)
+            np.subtract(self.phase_costs, row, out=self.phase_costs)
+            self.phase_costs[c] = w_c / e
+
+        self.active = 1 - self.active
+        self.table = new_table
+        self.iteration += 1
+
+    def label_state(self) -> int:
+        return hash((tuple(self.row), tuple(self.column)))
+
+    def track_stalling(self, r, c):
+        # called before every primal pivot; the pivot rules are deterministic,
+        # so leaving a basis left before means the same pivots repeat forever
+        state = self.label_state()
+        if state in self.visited:
+            self.stats['cycles'] += 1
+            self.stalled = True
+        self.visited.add(state)
+
+        # phase I pivots (negative `b` in the pivot row) neither start nor end a run
+        tol = 0.0 if self.tolerance is None else self.tolerance
+        b = self.table[:self.n, -1]
+        if b[r] < -tol:
+            return
 
-        # step 2: divide column with picked element by `e`
-        for rw in range(len(new_table)):
-            new_table[rw][c] = self.table[rw][c] / self.table[r][c]
+        # a zero step: some row with zero `b` blocks the entering column
+        if np.any((b <= tol) & (self.table[:self.n, c] < -tol)):
+            self.degenerate_run += 1
+            self.stats['degenerate'] += 1
+            self.stats['longest_run'] = max(self.stats['longest_run'], self.degenerate_run)
+            if self.degenerate_run >= self.stall_limit:
+                self.stalled = True
+        else:
+            self.degenerate_run = 0
+
+    def perturb(self) -> bool:
+        self.stalled = False
+        if self.perturbation_mode is None or self.perturbation is not None:
+            return False
+        if self.stats['perturbations'] >= self.perturbation_rounds:
+            return False
+
+        b = self.table[:self.n, -1]
+        delta = self.perturbation_delta = self.perturbation_scale * max(1.0, float(np.abs(b).max()))
+        if self.perturbation_mode == 'random':
+            rng = np.random.default_rng(self.perturbation_seed + self.stats['perturbations'])
+            perturbation = delta * (0.5 + rng.random(self.n))
+        else:
+            perturbation = delta * (1 - np.arange(self.n) / (2 * self.n))
+
+        # the objective row is not perturbed
+        self.perturbation = np.append(perturbation, 0.0)
+        self.table[:, -1] += self.perturbation
+        self.stats['perturbations'] += 1
+        self.degenerate_run = 0
+        self.visited.clear()
+        return True
+
+    def remove_perturbation(self) -> bool:
+        if self.perturbation is None:
+            return False
+        self.table[:, -1] -= self.perturbation
+        # what is left of `b` at the level of rounding errors of the perturbation is zero,
+        # otherwise the exact rule would take `-1e-22` for an infeasible row
+        b = self.table[:self.n, -1]
+        b[np.abs(b) <= 1e-6 * self.perturbation_delta] = 0.0
+        self.perturbation = None
+        self.visited.clear()
+        return True
+
+    def parallel_update(self, table, new_table, e):
+        # step 1 of `pivot` over contiguous ranges of lines (rows of wide tableaux, columns
+        # of tall ones), one range per thread; numpy releases the GIL inside ufunc loops
+        #
+        # every element goes through the same operations as in the single-threaded loop,
+        # so the result is bit-identical; products of a block are built from two operands
+        # of the block shape, because a broadcast operand makes numpy allocate buffers
+        if self.by_rows:
+            source, target, lead, other = table, new_table, self.pivot_column, self.pivot_row
+        else:
+            source, target, lead, other = table.T, new_table.T, self.pivot_row, self.pivot_column
+
+        lines, width = source.shape
+        chunk = max(1, self.thread_block // width)
+        if self.executor is None or len(self.thread_buffers) != self.threads:
+            if self.executor is not None:
+                self.executor.shutdown()
+            self.executor = ThreadPoolExecutor(self.threads)
+            self.thread_buffers = None
+        if self.thread_buffers is None or self.thread_buffers[0][0].shape != (chunk, width):
+            self.thread_buffers = [(np.empty((chunk, width)), np.empty((chunk, width))) for _ in range(self.threads)]
+
+        def update(lo, hi, products, others):
+            np.copyto(others, other)
+            for start in range(lo, hi, chunk):
+                stop = min(start + chunk, hi)
+                block, block_products = target[start:stop], products[:stop - start]
+                np.multiply(source[start:stop], e, out=block)
+                np.copyto(block_products, lead[start:stop, None])
+                np.multiply(block_products, others[:stop - start], out=block_products)
+                np.subtract(block, block_products, out=block)
+                np.divide(block, e, out=block)
+
+        bounds = np.linspace(0, lines, min(self.threads, lines) + 1).astype(int)
+        futures = [self.executor.submit(update, int(lo), int(hi), *buffers)
+                   for lo, hi, buffers in zip(bounds[:-1], bounds[1:], self.thread_buffers)]
+        for future in futures:
+            future.result()
+
+    def add_constraint(self, constraint):
+        # express `y = a * x + b` through the current non-basic variables
+        new_row = [0.0] * (self.m + 1)
+        new_row[-1] = constraint[-1]
+        for p in range(len(constraint) - 1):
+            label = 'x' + str(p + 1)
+            if label in self.row:
+                new_row[self.row.index(label)] += constraint[p]
+                continue
 
-        # step 3: inverse picked element
-        new_table[r][c] = 1.0 / self.table[r][c]
+            basic_row = self.table[self.column.index(label)]
+            for column in range(self.m + 1):
+                new_row[column] += constraint[p] * float(basic_row[column])
 
-        # step 4: recalculate matrix
-        for rw in range(len(new_table)):
-            if rw == r:
-                continue
-            for column in range(len(new_table[rw])):
-                if column == c:
-                    continue
+        label = 'y' + str(self.next_label)
+        self.next_label += 1
+        self.rhs[label] = constraint[-1]
 
-                new_table[rw][column] = (
-                        (self.table[rw][column] * self.table[r][c] -
-                         self.table[r][column] * self.table[rw][c]) / self.table[r][c])
+        # the shape changes, so the buffers are allocated again
+        self.set_table(np.insert(self.table, self.n, new_row, axis=0))
+        self.column.insert(self.n, label)
+        self.n += 1
+        self.invalid_index = 1 + max(self.n, self.m)
 
-        self.table = new_table
+        return self.get_dual_solution()
+
+    def remove_constraint(self, label):
+        if label in self.row:
+            raise ValueError("constraint is binding")
+        if label not in self.column[:-1]:
+            raise ValueError("unknown constraint")
+
+        # non-binding constraint is basic, so its row can be dropped without pivoting
+        idx = self.column.index(label)
+        self.set_table(np.delete(self.table, idx, axis=0))
+        self.column.pop(idx)
+        self.rhs.pop(label)
+        self.n -= 1
+        self.invalid_index = 1 + max(self.n, self.m)
+
+    def set_basis(self, column) -> bool:
+        # pivots the basic labels `column` of another tableau of the same problem into the basis;
+        # False if they do not fit this problem or the basis is singular, the tableau is then
+        # left between the two bases
+        basic = set(column) - {'f'}
+        if len(basic) != self.n or not basic <= set(self.row[:-1]) | set(self.column[:-1]):
+            return False
+
+        for label in [label for label in self.row[:-1] if label in basic]:
+            target_column = self.row.index(label)
+            rows = np.array([i for i in range(self.n) if self.column[i] not in basic])
+            values = np.abs(self.table[rows, target_column])
+            best = int(np.argmax(values))
+            # the largest element of the leaving rows, relative to the column
+            if values[best] <= 1e-9 * max(1.0, float(np.abs(self.table[:self.n, target_column]).max())):
+                return False
+            self.pivot(int(rows[best]), target_column)
+        return True
+
+    def set_checkpoint(self, path, every=100, interval=None):
+        # save state every `every` pivots and/or every `interval` seconds, None disables the trigger
+        self.checkpoint_path = path
+        self.checkpoint_every = every
+        self.checkpoint_interval = interval
+        self.last_checkpoint = (self.iteration, time.monotonic())
+
+    def update_checkpoint(self):
+        if self.checkpoint_path is None:
+            return
 
-    def get_solution(self):
-        result = []
-        result.append(Info(self.row, self.column, self.table, None, None, 0, 0, 0))
+        iteration, timestamp = self.last_checkpoint
+        if self.checkpoint_every is not None and self.iteration - iteration >= self.checkpoint_every:
+            self.save_checkpoint(self.checkpoint_path)
+        elif self.checkpoint_interval is not None and time.monotonic() - timestamp >= self.checkpoint_interval:
+            self.save_checkpoint(self.checkpoint_path)
+
+    def save_checkpoint(self, path):
+        # write to a temporary file first so a crash never leaves a broken checkpoint
+        tmp_path = str(path) + '.tmp'
+        table = self.table.copy()
+        # a resumed solve starts without the perturbation, it is added again if it stalls
+        if self.perturbation is not None:
+            table[:, -1] -= self.perturbation
+        with open(tmp_path, 'wb') as f:
+            np.savez_compressed(
+                f,
+                table=table[:-1],
+                objective=table[-1],
+                function=np.array(self.function, dtype=float),
+                row=np.array(self.row),
+                column=np.array(self.column),
+                rhs_labels=np.array(list(self.rhs.keys()), dtype=str),
+                rhs_values=np.array(list(self.rhs.values()), dtype=float),
+                counters=np.array([self.iteration, self.next_label]),
+            )
+        os.replace(tmp_path, path)
+        self.last_checkpoint = (self.iteration, time.monotonic())
+
+    @classmethod
+    def from_checkpoint(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            method = cls(data['table'].tolist(), data['function'].tolist())
+            # checkpoints written before the tableau became an array have no constant of f
+            objective = data['objective']
+            method.table[-1, :len(objective)] = objective
+            method.row = data['row'].tolist()
+            method.column = data['column'].tolist()
+            method.rhs = dict(zip(data['rhs_labels'].tolist(), data['rhs_values'].tolist()))
+            method.iteration, method.next_label = map(int, data['counters'])
+        return method
+
+    def check_limits(self, iterations, deadline, token):
+        # returns reason to stop the pivot loop, if any
+        if token is not None and token.cancelled:
+            return Status.Cancelled, "solution cancelled"
+        if iterations is not None and iterations <= 0:
+            return Status.IterationLimit, "iteration limit reached"
+        if deadline is not None and time.monotonic() >= deadline:
+            return Status.TimeLimit, "time limit reached"
+        return None
+
+    def get_dual_solution(self, max_iterations=None, time_limit=None, token=None):
+        deadline = None if time_limit is None else time.monotonic() + time_limit
+        start_iteration = self.iteration
+        x1, x2 = self.find_optimum()
+        result = [Info(self.row, self.column, self.table, None, None, x1, x2, self.f(x1, x2))]
 
         is_successful = True
         while is_successful:
+            # `b` of a new row or of a dual step at the level of rounding errors is zero, otherwise
+            # the exact rule would take `-1e-16` for an infeasible row without positive elements
+            b = self.table[:self.n, -1]
+            b[np.abs(b) <= 1e-12 * (1.0 + float(np.abs(b).max(initial=0.0)))] = 0.0
             try:
-                is_successful, i, j, e = self.pick_element()
+                is_successful, i, j, e = self.pick_dual_element()
             except ValueError as e:
+                self.status = Status.Failed
                 result.append(Error(str(e)))
                 return result
 
             if not is_successful:
                 break
 
+            iterations = None if max_iterations is None else max_iterations - (self.iteration - start_iteration)
+            limit = self.check_limits(iterations, deadline, token)
+            if limit is not None:
+                self.status = limit[0]
+                result.append(Error(limit[1]))
+                return result
+
             result[-1].i = i
             result[-1].j = j
-            self.recalculate_matrix()
+            self.pivot(i, j)
             x1, x2 = self.find_optimum()
             result.append(Info(self.row, self.column, self.table, None, None, x1, x2, self.f(x1, x2)))
+            self.update_checkpoint()
+
+        # finish with primal steps if row `c` was not optimal before
+        if max_iterations is not None:
+            max_iterations -= self.iteration - start_iteration
+        if deadline is not None:
+            time_limit = deadline - time.monotonic()
+        steps = self.get_solution(max_iterations, time_limit, token)
+        result[-1] = steps[0]
+        result.extend(steps[1:])
         return result
 
+    def get_solution(self, max_iterations=None, time_limit=None, token=None):
+        # stops with an `Error` once a limit is hit, all steps before it are kept
+        return list(self.solution_steps(max_iterations, time_limit, token))
+
+    def solution_steps(self, max_iterations=None, time_limit=None, token=None):
+        # yields every step as soon as its pivot element is known, same steps as `get_solution`
+        deadline = None if time_limit is None else time.monotonic() + time_limit
+        start_iteration = self.iteration
+        if self.phase_one == 'dual' and self.tolerance is None:
+            self.tolerance = 1e-9
+        if self.crash is not None and self.iteration == 0:
+            self.crash_pivots = CRASHES[self.crash](self)
+            start_iteration = self.iteration
+
+        x1, x2 = self.find_optimum()
+        current = Info(self.row, self.column, self.table, None, None, x1, x2, self.f(x1, x2))
+
+        is_successful = True
+        while is_successful:
+            try:
+                is_successful, i, j, e = self.pick_element()
+            except ValueError as e:
+                self.status = Status.Failed
+                yield current
+                yield Error(str(e))
+                return
+
+            if not is_successful:
+                # optimum of the perturbed problem, continue from its basis with the original `b`
+                if self.remove_perturbation():
+                    x1, x2 = self.find_optimum()
+                    current = Info(self.row, self.column, self.table, None, None, x1, x2, self.f(x1, x2))
+                    is_successful = True
+                    continue
+                break
+
+            iterations = None if max_iterations is None else max_iterations - (self.iteration - start_iteration)
+            limit = self.check_limits(iterations, deadline, token)
+            if limit is not None:
+                self.status = limit[0]
+                yield current
+                yield Error(limit[1])
+                return
+
+            # a stall is handled before its pivot, the element is picked again on the perturbed `b`
+            self.track_stalling(i, j)
+            if self.stalled and self.perturb():
+                x1, x2 = self.find_optimum()
+                current = Info(self.row, self.column, self.table, None, None, x1, x2, self.f(x1, x2))
+                continue
+
+            current.i = i
+            current.j = j
+            yield current
+            # the shown element, picking again would move the window of partial pricing
+            self.pivot(i, j)
+            x1, x2 = self.find_optimum()
+            current = Info(self.row, self.column, self.table, None, None, x1, x2, self.f(x1, x2))
+            self.update_checkpoint()
+
+        self.status = Status.Optimal
+        yield current
 
 # Constraints such as
 # y = a * x1 + b * x2 + c > 0
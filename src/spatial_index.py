@@ -0,0 +1,119 @@
+import numpy as np
+
+
+# Uniform grid over the plot for hit-testing constraint lines
+#
+# every line is registered in the cells its infinite line crosses inside `bounds`,
+# its endpoints and gradient point in the cells they fall into (clamped to the grid);
+# with cells at least twice the hit tolerance, a hit lies in the 3x3 block around the click,
+# so a query returns a few candidates that are then checked exactly by the caller
+class SpatialIndex:
+    def __init__(self):
+        self.params = None
+        self.size = 0
+        self.segments = np.empty((0, 2, 2))
+        self.lines = {}
+        self.points = {}
+        self.line_keys = []
+        self.point_keys = []
+
+    def update(self, segments, bounds: (float, float), cell: float, scale: float):
+        # `segments` is the (N, 2, 2) array of all lines, only changed lines are reinserted
+        segments = np.array(segments, dtype=float).reshape(-1, 2, 2)
+        params = (bounds, cell, scale)
+        old = self.segments
+
+        if params != self.params or len(segments) < len(old):
+            # limits changed or lines were removed, which shifts the indices
+            self.params = params
+            self.size = max(1, int(np.ceil((bounds[1] - bounds[0]) / cell)))
+            self.lines, self.points = {}, {}
+            self.line_keys, self.point_keys = [], []
+            self.insert(segments, np.arange(len(segments)))
+        else:
+            changed = np.flatnonzero((segments[:len(old)] != old).any(axis=(1, 2)))
+            for i in changed:
+                self.remove(i)
+            self.insert(segments, np.concatenate([changed, np.arange(len(old), len(segments))]).astype(int))
+        self.segments = segments
+
+    def query_lines(self, x: float, y: float) -> list:
+        return self.query(self.lines, x, y)
+
+    def query_points(self, x: float, y: float) -> list:
+        return self.query(self.points, x, y)
+
+    def query(self, grid: dict, x: float, y: float) -> list:
+        ix, iy = self.cell_of(np.array([[x, y]]))[0]
+        candidates = set()
+        for cx in range(max(0, ix - 1), min(self.size, ix + 2)):
+            for cy in range(max(0, iy - 1), min(self.size, iy + 2)):
+                candidates.update(grid.get(cx * self.size + cy, ()))
+        return sorted(candidates)
+
+    def cell_of(self, points: np.ndarray) -> np.ndarray:
+        (lo, _), cell, _ = self.params
+        return np.clip(((points - lo) // cell).astype(int), 0, self.size - 1)
+
+    def keys_of(self, points: np.ndarray) -> np.ndarray:
+        cells = self.cell_of(points)
+        return cells[..., 0] * self.size + cells[..., 1]
+
+    def insert(self, segments: np.ndarray, ids: np.ndarray):
+        if len(ids) == 0:
+            return
+        line_keys = self.rasterize(segments[ids])
+        point_keys = self.keys_of(np.stack([segments[ids, 0], segments[ids, 1], self.gradient_points(segments[ids])], axis=1))
+
+        for n, i in enumerate(ids.tolist()):
+            if i == len(self.line_keys):
+                self.line_keys.append(None)
+                self.point_keys.append(None)
+            self.line_keys[i] = line_keys[n]
+            self.point_keys[i] = np.unique(point_keys[n])
+            for key in self.line_keys[i].tolist():
+                self.lines.setdefault(key, set()).add(i)
+            for key in self.point_keys[i].tolist():
+                self.points.setdefault(key, set()).add(i)
+
+    def remove(self, i: int):
+        for grid, keys in ((self.lines, self.line_keys[i]), (self.points, self.point_keys[i])):
+            for key in keys.tolist():
+                grid[key].discard(i)
+                if not grid[key]:
+                    del grid[key]
+
+    def rasterize(self, segments: np.ndarray) -> list:
+        # cells crossed by the infinite lines through `segments`, clipped to the grid
+        (lo, hi), cell, _ = self.params
+        begin = segments[:, 0]
+        direction = segments[:, 1] - segments[:, 0]
+        length = np.hypot(direction[:, 0], direction[:, 1])
+
+        # slab clipping of `begin + t * direction` against the square [lo, hi]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t1 = (lo - begin) / direction
+            t2 = (hi - begin) / direction
+        flat = np.abs(direction) < 1e-12
+        inside = (begin >= lo) & (begin <= hi)
+        t_min = np.where(flat, np.where(inside, -np.inf, np.inf), np.minimum(t1, t2)).max(axis=1)
+        t_max = np.where(flat, np.where(inside, np.inf, -np.inf), np.maximum(t1, t2)).min(axis=1)
+        # degenerate lines are never hit by `is_point_on_line`
+        valid = (length > 1e-12) & (t_min <= t_max)
+
+        # samples half a cell apart never skip a cell by more than a neighbour
+        count = int(np.ceil((hi - lo) * np.sqrt(2) / (cell / 2))) + 2
+        t_min, t_max = np.where(valid, t_min, 0), np.where(valid, t_max, 0)
+        t = t_min[:, None] + (t_max - t_min)[:, None] * np.linspace(0, 1, count)
+        keys = self.keys_of(begin[:, None] + t[..., None] * direction[:, None])
+        return [np.unique(keys[n]) if valid[n] else np.empty(0, dtype=int) for n in range(len(segments))]
+
+    def gradient_points(self, segments: np.ndarray) -> np.ndarray:
+        # vectorized `gradient_point` of plot_widget
+        scale = self.params[2]
+        direction = segments[:, 1] - segments[:, 0]
+        norm_factor = np.hypot(direction[:, 0], direction[:, 1])
+        norm_factor[norm_factor < 1e-4] = 1
+        normal = np.column_stack([-direction[:, 1], direction[:, 0]]) / norm_factor[:, None]
+        return segments.mean(axis=1) + normal * scale
+
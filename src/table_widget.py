@@ -1,6 +1,6 @@
-from PyQt5.QtCore import Qt, pyqtSlot
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
 from PyQt5.QtGui import QBrush, QColor
-from PyQt5.QtWidgets import QWidget, QTableWidget, QTableWidgetItem, QVBoxLayout, QMessageBox
+from PyQt5.QtWidgets import QWidget, QTableView, QHeaderView, QVBoxLayout, QMessageBox
 
 from atom import Atom, LineEntry
 from equations import table_row_to_vector, shrink_line
@@ -18,44 +18,192 @@ def is_float(element: any) -> bool:
         return False
 
 
-def decode_row(row) -> list:
-    decoded_row = []
-    for item in row:
-        if item and is_float(item.text()):
-            decoded_row.append(item.text())
+# Model over `Atom.lines` + gradient (modification) or over `Info.table` (viewing)
+#
+# `rows` holds the values currently shown, `refresh` compares it with the source
+# and signals only the cells that changed; text is produced on demand for visible cells
+class TableModel(QAbstractTableModel):
+    invalid_value = pyqtSignal(str)
+    edited = pyqtSignal(str)
+
+    def __init__(self, atom: Atom):
+        super().__init__()
+        self.atom = atom
+        self.info = None
+        self.rows = self.snapshot()
+        self.header_row, self.header_column = self.labels()
+
+    def snapshot(self) -> list:
+        if self.info is None:
+            rows = [list(entry.coeffs) for entry in self.atom.lines]
+            rows.append(list(self.atom.grad[:-1]) + [0])
+            return rows
+
+        rows = self.info.table[:-1].tolist()
+        rows.append(self.info.table[-1, :len(self.info.row) - 1].tolist() + [self.info.optimum])
+        return rows
+
+    def labels(self) -> (list, list):
+        if self.info is None:
+            column = [f"y{row}" for row in range(1, len(self.atom.lines) + 1)]
+            column.append('f')
+            return ['x1', 'x2', '-b'], column
+        return list(self.info.row), list(self.info.column)
+
+    def pivot(self):
+        if self.info is None:
+            return None
+        return self.info.i, self.info.j
+
+    def rowCount(self, parent=QModelIndex()):
+        return len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.header_row)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row, col = index.row(), index.column()
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            value = self.rows[row][col]
+            if not is_float(value):
+                return '0'
+            # `+ 0.0` turns `-0.0` into `0.0`
+            return str(round(value, 2) + 0.0) if self.info is not None else str(value)
+
+        # highlight important element
+        if role == Qt.BackgroundRole and (row, col) == self.pivot():
+            return QBrush(QColor(255, 0, 0))
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        labels = self.header_row if orientation == Qt.Horizontal else self.header_column
+        return labels[section] if section < len(labels) else None
+
+    def flags(self, index):
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        # `-b` of the gradient is not editable
+        if self.info is None and not (index.row() == len(self.rows) - 1 and index.column() == 2):
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or not index.isValid() or self.info is not None:
+            return False
+        if self.atom.state != ProgramState.Modification:
+            return False
+
+        if not is_float(value):
+            self.invalid_value.emit(str(value))
+            return False
+
+        row, col = index.row(), index.column()
+        value = float(value)
+
+        # gradient
+        if row == len(self.atom.lines):
+            grad = list(self.atom.grad)
+            grad[col] = value
+            self.atom.grad = grad
+            field = 'grad'
         else:
-            decoded_row.append(None)
-    return decoded_row
+            coeffs = [value if c == col else float(v) for c, v in enumerate(self.atom.lines[row].coeffs)]
+            x1, x2, b = coeffs
+            self.atom.lines[row] = LineEntry(x1, x2, b, shrink_line(table_row_to_vector(x1, x2, b, lim=self.atom.lim)))
+            field = 'lines'
+
+        self.refresh()
+        self.edited.emit(field)
+        return True
+
+    def show_atom(self):
+        self.set_source(None)
+
+    def show_info(self, info: Info):
+        self.set_source(info)
+
+    def set_source(self, info):
+        # switching between modes changes flags and headers of every cell, start over
+        if (info is None) != (self.info is None):
+            self.beginResetModel()
+            self.info = info
+            self.rows = self.snapshot()
+            self.header_row, self.header_column = self.labels()
+            self.endResetModel()
+            return
+
+        self.info = info
+        self.refresh()
+
+    def refresh(self):
+        old_rows, old_pivot = self.rows, self.pivot()
+        new_rows = self.snapshot()
+        header_row, header_column = self.labels()
+
+        if len(header_row) != len(self.header_row):
+            self.beginResetModel()
+            self.rows = new_rows
+            self.header_row, self.header_column = header_row, header_column
+            self.endResetModel()
+            return
+
+        # rows are only ever added or removed at the end of the view
+        if len(new_rows) > len(old_rows):
+            self.beginInsertRows(QModelIndex(), len(old_rows), len(new_rows) - 1)
+            self.rows, self.header_column = new_rows, header_column
+            self.endInsertRows()
+        elif len(new_rows) < len(old_rows):
+            self.beginRemoveRows(QModelIndex(), len(new_rows), len(old_rows) - 1)
+            self.rows, self.header_column = new_rows, header_column
+            self.endRemoveRows()
+        self.rows = new_rows
+
+        for row in range(min(len(old_rows), len(new_rows))):
+            old, new = old_rows[row], new_rows[row]
+            changed = [col for col in range(len(new)) if old[col] != new[col]]
+            if changed:
+                self.dataChanged.emit(self.index(row, changed[0]), self.index(row, changed[-1]))
+
+        if self.pivot() != old_pivot:
+            for pivot in (old_pivot, self.pivot()):
+                if pivot is not None and pivot[0] is not None and pivot[0] < len(new_rows):
+                    index = self.index(pivot[0], pivot[1])
+                    self.dataChanged.emit(index, index, [Qt.BackgroundRole])
+
+        if header_row != self.header_row:
+            self.header_row = header_row
+            self.headerDataChanged.emit(Qt.Horizontal, 0, len(header_row) - 1)
+        if header_column != self.header_column:
+            self.header_column = header_column
+            self.headerDataChanged.emit(Qt.Vertical, 0, len(header_column) - 1)
 
 
 class TableWidget(QWidget):
     def __init__(self, atom: Atom):
         super().__init__()
         self.__atom = atom
-        self.__header_row = ['x1', 'x2', '-b']
-        self.__header_column = ['f']
-
-        self.table_widget = QTableWidget()
-        self.table_widget.setRowCount(1)
-        self.table_widget.setColumnCount(3)
-        self.table_widget.setHorizontalHeaderLabels(self.__header_row)
-        self.table_widget.setVerticalHeaderLabels(self.__header_column)
-
-        for i in range(2):
-            self.table_widget.setItem(0, i, QTableWidgetItem('1'))
-        item = QTableWidgetItem('0')
-        item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-        self.table_widget.setItem(0, 2, item)
         self.__atom.grad = [0, 1, 0]
 
+        self.model = TableModel(self.__atom)
+        self.model.invalid_value.connect(self.invalid_value)  # type: ignore
+        self.model.edited.connect(self.data_changed)  # type: ignore
+
+        self.table_view = QTableView()
+        self.table_view.setModel(self.model)
+
+        # fixed row height, so only visible rows are ever measured
+        self.table_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+
         layout = QVBoxLayout()
-        layout.addWidget(self.table_widget)
+        layout.addWidget(self.table_view)
         self.setLayout(layout)
 
-        self.table_widget.itemChanged.connect(self.data_changed)  # type: ignore
-
         self.update_column_widths()
-        self.table_widget.horizontalHeader().sectionResized.connect(self.update_column_widths)
+        self.table_view.horizontalHeader().sectionResized.connect(self.update_column_widths)
         self.resizeEvent = self.onResize
 
     def onResize(self, event):
@@ -68,191 +216,53 @@ class TableWidget(QWidget):
     def update_column_widths(self):
         """Calculates and sets column widths based on the available space."""
         # Get the total width of the table (adjusting for scrollbars if present)
-        total_width = self.table_widget.viewport().width()
+        total_width = self.table_view.viewport().width()
 
         # Distribute width proportionally (e.g., 33% for each column).
-        column_width = total_width // self.table_widget.columnCount()
-
-        for i in range(self.table_widget.columnCount()):
-            self.table_widget.setColumnWidth(i, column_width)
+        column_width = total_width // self.model.columnCount()
 
-    def update_labels(self):
-        labels = [f"y{row}" for row in range(1, self.table_widget.rowCount())]
-        labels.append('f')
-        self.table_widget.setHorizontalHeaderLabels(self.__header_row)
-        self.table_widget.setVerticalHeaderLabels(labels)
+        for i in range(self.model.columnCount()):
+            self.table_view.setColumnWidth(i, column_width)
 
     def update_from_info(self, info: Info):
-        # disconnect update function
-        self.table_widget.itemChanged.disconnect(self.data_changed)  # type: ignore
-
-        while self.table_widget.rowCount() > 0:
-            self.table_widget.removeRow(0)
-
-        table = info.table
-        for i in range(len(table) - 1):
-            row_idx = self.table_widget.rowCount()
-            self.table_widget.insertRow(row_idx)
-
-            data = table[i]
-            for col in range(self.table_widget.columnCount()):
-                item = QTableWidgetItem(str(round(data[col], 2)) if is_float(data[col]) else '0')
-                item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-
-                # highlight important element
-                if row_idx == info.i and col == info.j:
-                    item.setBackground(QBrush(QColor(255, 0, 0)))
-
-                self.table_widget.setItem(row_idx, col, item)
-
-        # gradient
-        row_idx = self.table_widget.rowCount()
-        self.table_widget.insertRow(row_idx)
-
-        data = table[-1]
-        for col in range(self.table_widget.columnCount() - 1):
-            item = QTableWidgetItem(str(round(data[col], 2)) if is_float(data[col]) else '0')
-            item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-            self.table_widget.setItem(row_idx, col, item)
-        item = QTableWidgetItem('0')
-        item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-        self.table_widget.setItem(row_idx, 2, item)
-
-        # optimal point
-        row = self.table_widget.rowCount() - 1
-        col = self.table_widget.columnCount() - 1
-        item = QTableWidgetItem(str(round(info.optimum, 2)))
-        item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-        self.table_widget.setItem(row, col, item)
-
-        # labels
-        self.table_widget.setHorizontalHeaderLabels(info.row)
-        column_labels = info.column
-        self.table_widget.setVerticalHeaderLabels(column_labels)
-
-        # reconnect update function
-        self.table_widget.itemChanged.connect(self.data_changed)  # type: ignore
+        self.model.show_info(info)
 
     def insert_row(self):
         if self.__atom.state != ProgramState.Modification:
             return
 
-        # disconnect update function
-        self.table_widget.itemChanged.disconnect(self.data_changed)  # type: ignore
-
-        row_idx = self.table_widget.rowCount() - 1
-        self.table_widget.insertRow(row_idx)
-        self.update_labels()
-
-        for col in range(self.table_widget.columnCount()):
-            item = QTableWidgetItem('0')
-            item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable)
-            self.table_widget.setItem(row_idx, col, item)
-
-        # reconnect update function
-        self.table_widget.itemChanged.connect(self.data_changed)  # type: ignore
-
         # add associated row
         self.__atom.lines.append(LineEntry(0, 0, 0, Line(Point(0, 0), Point(0, 0))))
-        self.__atom.remove_observer(self)
-        self.__atom.notify_observers()
-        self.__atom.add_observer(self)
+        self.model.refresh()
+        self.__atom.notify_observers('lines', source=self)
 
     def remove_row(self):
         if self.__atom.state != ProgramState.Modification:
             return
 
-        current_row = self.table_widget.currentRow()
-        if current_row >= self.table_widget.rowCount():
+        current_row = self.table_view.currentIndex().row()
+        if current_row >= self.model.rowCount():
             return
-        if current_row == self.table_widget.rowCount() - 1:
+        if current_row == self.model.rowCount() - 1:
             current_row -= 1
         if current_row >= 0:
-            self.table_widget.removeRow(current_row)
-            self.update_labels()
-
             # remove associated row
             self.__atom.lines.pop(current_row)
-            self.__atom.remove_observer(self)
-            self.__atom.notify_observers()
-            self.__atom.add_observer(self)
+            self.model.refresh()
+            self.__atom.notify_observers('lines', source=self)
 
-    @pyqtSlot(QTableWidgetItem)
-    def data_changed(self, item):
-        if self.__atom.state != ProgramState.Modification:
-            return
+    def invalid_value(self, value):
+        QMessageBox.critical(self, "Ошибка", f"Элемент таблицы не является вещественным числом: {value}")
 
-        row = item.row()
-        col = item.column()
-        value = self.table_widget.item(row, col).text()
-
-        if not is_float(value):
-            QMessageBox.critical(self, "Ошибка", f"Элемент таблицы не является вещественным числом: {value}")
-            item = QTableWidgetItem('0')
-            item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable)
-            self.table_widget.setItem(row, col, item)
-            return
+    def data_changed(self, field):
+        self.__atom.notify_observers(field, source=self)
 
-        # disconnect update function
-        self.table_widget.itemChanged.disconnect(self.data_changed)  # type: ignore
-
-        row_data = []
-        for c in range(self.table_widget.columnCount()):
-            row_data.append(self.table_widget.item(row, c))
-        row_data = decode_row(row_data)
-
-        # ignore invalid input (use old values)
-        if not all(is_float(x) for x in row_data):
-            return
-
-        # gradient
-        if row + 1 == self.table_widget.rowCount():
-            self.__atom.grad = list(map(float, row_data))
-        else:
-            x1, x2, b = map(float, row_data)
-            self.__atom.lines[row] = LineEntry(x1, x2, b, shrink_line(table_row_to_vector(x1, x2, b, lim=self.__atom.lim)))
-
-        # reconnect update function
-        self.table_widget.itemChanged.connect(self.data_changed)  # type: ignore
-        self.__atom.remove_observer(self)
-        self.__atom.notify_observers()
-        self.__atom.add_observer(self)
-
-    def update(self):
+    def update(self, fields=None):
         if self.__atom.state != ProgramState.Modification:
             return
 
-        # disconnect update function
-        self.table_widget.itemChanged.disconnect(self.data_changed)  # type: ignore
-
-        while self.table_widget.rowCount() > 0:
-            self.table_widget.removeRow(0)
-
-        for i in range(len(self.__atom.lines)):
-            row_idx = self.table_widget.rowCount()
-            self.table_widget.insertRow(row_idx)
-
-            data = self.__atom.lines[i].coeffs
-            for col in range(self.table_widget.columnCount()):
-                item = QTableWidgetItem(str(data[col]) if is_float(data[col]) else '0')
-                item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable)
-                self.table_widget.setItem(row_idx, col, item)
+        # limits are not shown in the table
+        if fields is not None and not fields & {'lines', 'grad', 'state'}:
+            return
 
-        # gradient
-        row_idx = self.table_widget.rowCount()
-        self.table_widget.insertRow(row_idx)
-
-        data = self.__atom.grad
-        for col in range(self.table_widget.columnCount() - 1):
-            item = QTableWidgetItem(str(data[col]) if is_float(data[col]) else '0')
-            item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable)
-            self.table_widget.setItem(row_idx, col, item)
-        item = QTableWidgetItem('0')
-        item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-        self.table_widget.setItem(row_idx, 2, item)
-
-        # labels
-        self.update_labels()
-
-        # reconnect update function
-        self.table_widget.itemChanged.connect(self.data_changed)  # type: ignore
+        self.model.show_atom()
@@ -0,0 +1,80 @@
+import numpy as np
+
+from simplex import SimplexMethod
+
+
+# Post-solve certificate of a final tableau, checked against the original problem
+#
+# min f = c * x + c0 subject to y = a * x + b >= 0 and x >= 0 is solved by x and the duals u
+# exactly when (KKT conditions)
+#   primal feasibility        y = a * x + b >= 0, x >= 0
+#   dual feasibility          u >= 0, d = c - a^T * u >= 0
+#   complementary slackness   u * y = 0, d * x = 0
+#
+# x is read from the `b` column and u from the objective row: the reduced costs of the
+# non-basic `y`, the shadow prices of `Sensitivity` with the opposite sign; y, d and f are
+# computed again from `constraints` and `function` rather than taken from the tableau, so the
+# error that pivoting accumulated shows up in the residuals
+#
+# residuals are relative: primal ones to 1 + the largest |b|, dual ones to 1 + the largest |c|,
+# complementarity and the objective to 1 + |f|; a solution is `accepted` if none is over `tol`
+#
+# `constraints[i]` is the constraint `y{i + 1}` (the ones of `add_constraint` follow in order),
+# constraints removed from the tableau are left out; two products with `a`, so the check costs
+# about as much as one pivot
+class Verification:
+    def __init__(self, method: SimplexMethod, constraints, function, tol=1e-7):
+        self.tol = tol
+        a = np.asarray(constraints, dtype=float)
+        k = len(a)
+        m = a.shape[1] - 1
+        b = a[:, -1]
+        a = a[:, :-1]
+        c = np.zeros(m)
+        c[:min(m, len(function))] = function[:m]
+        c0 = float(function[m]) if len(function) > m else 0.0
+
+        table = method.table
+        self.x = np.zeros(m)
+        self.u = np.zeros(k)
+        present = np.zeros(k, dtype=bool)
+        for i, label in enumerate(method.column[:-1]):
+            p = int(label[1:]) - 1
+            if label[0] == 'x':
+                self.x[p] = table[i, -1]
+            elif p < k:
+                present[p] = True
+        for j, label in enumerate(method.row[:-1]):
+            p = int(label[1:]) - 1
+            if label[0] == 'y' and p < k:
+                self.u[p] = table[-1, j]
+                present[p] = True
+
+        a, b, self.u = a[present], b[present], self.u[present]
+        self.labels = ['y' + str(p + 1) for p in np.flatnonzero(present).tolist()]
+        self.y = a @ self.x + b
+        self.d = c - self.u @ a
+        self.optimum = float(c @ self.x) + c0
+        self.dual_optimum = c0 - float(b @ self.u)
+
+        primal_scale = 1.0 + float(np.abs(b).max(initial=0.0))
+        dual_scale = 1.0 + float(np.abs(c).max(initial=0.0))
+        value_scale = 1.0 + abs(self.optimum)
+        self.residuals = {
+            'primal': max(0.0, -float(self.y.min(initial=0.0)),
+                          -float(self.x.min(initial=0.0))) / primal_scale,
+            'dual': max(0.0, -float(self.u.min(initial=0.0)), -float(self.d.min(initial=0.0))) / dual_scale,
+            'complementarity': max(float(np.abs(self.u * self.y).max(initial=0.0)),
+                                   float(np.abs(self.d * self.x).max(initial=0.0))) / value_scale,
+            # f of the tableau against f of x, and the duality gap
+            'objective': max(abs(float(table[-1, -1]) - self.optimum),
+                             abs(self.optimum - self.dual_optimum)) / value_scale,
+        }
+        self.error = max(self.residuals.values())
+        self.accepted = self.error <= tol
+
+    def violations(self) -> list:
+        return [name for name, value in self.residuals.items() if value > self.tol]
+
+    def to_dict(self) -> dict:
+        return {'accepted': self.accepted, 'error': self.error, 'residuals': dict(self.residuals)}
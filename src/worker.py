@@ -0,0 +1,48 @@
+import time
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from simplex import SimplexMethod, CancellationToken, Error, Status
+
+
+class SolveSignals(QObject):
+    # (token, batch of `Info`/`Error` steps), then (token, final `Status`)
+    # the token tells the receiver which solve the steps belong to
+    steps = pyqtSignal(object, object)
+    finished = pyqtSignal(object, object)
+
+
+# Runs `SimplexMethod` on a `QThreadPool` thread and streams the steps to the GUI
+#
+# steps are sent in batches at most every `interval` seconds, so a fast solve
+# does not flood the event loop with one signal per pivot
+#
+# the pool deletes the worker once `run` returns, so `signals` belong to the
+# receiver and outlive it, and the receiver keeps only the token
+class SolveWorker(QRunnable):
+    def __init__(self, constraints, function, signals: SolveSignals, token: CancellationToken, interval=0.05):
+        super().__init__()
+        self.constraints = constraints
+        self.function = function
+        self.signals = signals
+        self.token = token
+        self.interval = interval
+
+    def run(self):
+        method = SimplexMethod(self.constraints, self.function)
+        batch = []
+        last_emit = time.monotonic()
+        try:
+            for step in method.solution_steps(token=self.token):
+                batch.append(step)
+                if time.monotonic() - last_emit >= self.interval:
+                    self.signals.steps.emit(self.token, batch)
+                    batch = []
+                    last_emit = time.monotonic()
+        except Exception as e:
+            # an exception would end the thread silently and leave the GUI waiting
+            method.status = Status.Failed
+            batch.append(Error(str(e)))
+
+        self.signals.steps.emit(self.token, batch)
+        self.signals.finished.emit(self.token, method.status)
@@ -0,0 +1,50 @@
+import itertools
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from branch_and_bound import BranchAndBound
+from simplex import Status
+
+
+def brute_force(constraints, function, limit):
+    # min f over integer points of the box [0, limit]^m that satisfy every constraint
+    a = np.asarray(constraints, dtype=float)
+    best = None
+    for x in itertools.product(range(limit + 1), repeat=a.shape[1] - 1):
+        if (a[:, :-1] @ x + a[:, -1] >= -1e-9).all():
+            value = float(np.dot(function[:len(x)], x)) + (function[len(x)] if len(function) > len(x) else 0.0)
+            best = value if best is None else min(best, value)
+    return best
+
+
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize('node_selection', ['best', 'depth'])
+def test_matches_enumeration_with_the_input_of_simplex_method(seed, node_selection):
+    # `function` is `[c1, c2, c3]` as for `SimplexMethod`, the box keeps the problem bounded
+    rng = np.random.default_rng(seed)
+    m, limit = 3, 4
+    constraints = [[-float(v) for v in rng.integers(1, 6, size=m)] + [float(rng.integers(5, 20))]]
+    constraints += [[-1.0 if j == k else 0.0 for j in range(m)] + [float(limit)] for k in range(m)]
+    function = [-float(v) for v in rng.integers(1, 10, size=m)]
+
+    method = BranchAndBound(constraints, function)
+    method.node_selection = node_selection
+    assert method.solve() == Status.Optimal
+    assert method.optimum == pytest.approx(brute_force(constraints, function, limit))
+    assert method.optimum == pytest.approx(float(np.dot(function, method.x)))
+
+
+def test_constant_of_function_is_added_to_optimum():
+    method = BranchAndBound([[-2, -2, 7]], [-1, -1, 5])
+    assert method.solve() == Status.Optimal
+    assert method.optimum == pytest.approx(2.0)
+
+
+def test_function_longer_than_variables_and_constant_is_rejected():
+    with pytest.raises(ValueError):
+        BranchAndBound([[-2, -2, 7]], [-1, -1, 5, 1])
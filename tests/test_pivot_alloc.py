@@ -0,0 +1,44 @@
+import os
+import sys
+import tracemalloc
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from simplex import SimplexMethod
+
+
+def pivot_allocations(constraints, function, pivots=1000) -> (int, int):
+    # net and peak bytes allocated by `pivots` pivots after a warm-up, a pivot on the same
+    # element twice restores the tableau, so the loop runs on the same values
+    method = SimplexMethod(constraints, function)
+    r, c = 0, 0
+    for _ in range(10):
+        method.pivot(r, c)
+
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for _ in range(pivots):
+            method.pivot(r, c)
+        end, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return end - start, peak - start
+
+
+@pytest.mark.parametrize('n, m', [(2000, 2), (2, 2000), (100, 100)])
+def test_pivot_loop_allocates_no_arrays(n, m):
+    rng = np.random.default_rng(0)
+    constraints = rng.uniform(1, 2, size=(n, m + 1)).tolist()
+    function = rng.uniform(1, 2, size=m).tolist()
+    tableau = (n + 1) * (m + 1) * 8
+
+    net, peak = pivot_allocations(constraints, function)
+
+    # views and Python floats only, nothing of the size of a row, a column or the tableau
+    assert net <= 1024
+    assert peak <= min(4096, tableau // 10)